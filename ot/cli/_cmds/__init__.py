@@ -0,0 +1,34 @@
+"""Subcommand implementations for the ``ot`` CLI.
+
+Each command lives in its own module so that ``ot.cli.main`` can import
+them lazily, only when the command is actually invoked.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _to_path(ctx: click.Context, param: click.Parameter, value: str | None) -> Path | None:
+    """Convert an option value to a Path, importing pathlib only when set."""
+    if value is None:
+        return None
+    
+    from pathlib import Path
+    
+    return Path(value)
+
+
+# Shared -c/--config option for commands that load a configuration file
+config_option = click.option(
+    "-c", "--config",
+    type=click.Path(exists=True),
+    default=None,
+    callback=_to_path,
+    help="Path to configuration file.",
+)
@@ -0,0 +1,13 @@
+"""The ``ot menu`` command."""
+
+from __future__ import annotations
+
+import click
+
+
+@click.command()
+def menu() -> None:
+    """Open the interactive menu."""
+    from ..menu import run_menu
+    
+    run_menu()
@@ -0,0 +1,63 @@
+"""The ``ot schedule`` command group."""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+
+# Frequencies accepted by 'ot schedule set' (keys of SCHEDULE_PRESETS)
+_FREQS = ("15min", "30min", "hourly", "daily")
+
+
+@click.group()
+def schedule() -> None:
+    """Manage automatic sync schedule."""
+    pass
+
+
+@schedule.command("set")
+@click.argument(
+    "frequency",
+    type=click.Choice(_FREQS, case_sensitive=False),
+)
+def schedule_set(frequency: str) -> None:
+    """Set the auto-sync frequency.
+    
+    FREQUENCY: 15min, 30min, hourly, or daily
+    """
+    from ...scheduler import add_sync_schedule, describe_schedule, SCHEDULE_PRESETS
+    
+    if add_sync_schedule(frequency):
+        cron_expr = SCHEDULE_PRESETS[frequency]
+        click.echo(f"✅ Auto-sync enabled: {describe_schedule(cron_expr)}")
+    else:
+        click.echo("❌ Failed to set schedule", err=True)
+        sys.exit(1)
+
+
+@schedule.command("remove")
+def schedule_remove() -> None:
+    """Remove the auto-sync schedule."""
+    from ...scheduler import remove_sync_schedule
+    
+    if remove_sync_schedule():
+        click.echo("✅ Auto-sync disabled")
+    else:
+        click.echo("❌ Failed to remove schedule", err=True)
+        sys.exit(1)
+
+
+@schedule.command("show")
+def schedule_show() -> None:
+    """Show the current sync schedule."""
+    from ...scheduler import get_current_schedule, describe_schedule
+    
+    schedule = get_current_schedule()
+    if schedule:
+        click.echo(f"Current schedule: {describe_schedule(schedule)}")
+        click.echo(f"Cron expression: {schedule}")
+    else:
+        click.echo("No auto-sync schedule configured.")
+        click.echo("Use 'ot schedule set <frequency>' to enable.")
@@ -0,0 +1,21 @@
+"""The ``ot setup`` command."""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+
+@click.command()
+def setup() -> None:
+    """Run the interactive configuration wizard.
+    
+    This will guide you through setting up the sync configuration.
+    """
+    from ..wizard import run_wizard
+    
+    config = run_wizard()
+    if config is None:
+        click.echo("Setup cancelled.", err=True)
+        sys.exit(1)
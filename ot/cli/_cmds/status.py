@@ -0,0 +1,94 @@
+"""The ``ot status`` command."""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import click
+
+from . import config_option
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@click.command()
+@config_option
+def status(config: Path | None) -> None:
+    """Check the current configuration and sync status."""
+    if not print_status(config):
+        sys.exit(1)
+
+
+def print_status(config_path: Path | None = None) -> bool:
+    """Print the current configuration and sync status.
+    
+    Args:
+        config_path: Path to the config file. Defaults to ~/.config/ot/config.yaml
+        
+    Returns:
+        True if the configuration was loaded, False otherwise.
+    """
+    from ...config import load_config, ConfigError, DEFAULT_CONFIG_FILE
+    
+    config_path = config_path or DEFAULT_CONFIG_FILE
+    
+    try:
+        cfg = load_config(config_path)
+    except ConfigError as e:
+        click.echo(f"❌ Configuration error: {e}", err=True)
+        click.echo(f"\nNo configuration found at {config_path}")
+        click.echo("Run 'ot setup' to create a configuration.")
+        return False
+    
+    click.echo("\n".join([
+        "📋 Current Configuration:",
+        f"   Source:      {cfg.source_dir}",
+        f"   Destination: {cfg.dest_dir}",
+        f"   Log Dir:     {cfg.log_dir}",
+        f"   SSH Key:     {cfg.ssh_key_path or 'Not configured'}",
+        f"   Log Retention: {cfg.log_retention_days} days",
+    ]))
+    
+    # Check paths
+    lines = ["\n🔍 Path Status:"]
+    
+    if cfg.source_dir.exists():
+        lines.append("   ✅ Source exists")
+    else:
+        lines.append(f"   ❌ Source not found: {cfg.source_dir}")
+    
+    if cfg.dest_dir.exists():
+        from ...git_ops import is_git_repo, get_remote_url, get_current_branch
+        
+        if is_git_repo(cfg.dest_dir):
+            lines.append("   ✅ Destination is a Git repository")
+            
+            branch = get_current_branch(cfg.dest_dir)
+            if branch:
+                lines.append(f"      Branch: {branch}")
+            
+            remote = get_remote_url(cfg.dest_dir)
+            if remote:
+                lines.append(f"      Remote: {remote}")
+            else:
+                lines.append("      ⚠️ No remote configured")
+        else:
+            lines.append("   ⚠️ Destination exists but is not a Git repo")
+    else:
+        lines.append(f"   ❌ Destination not found: {cfg.dest_dir}")
+    
+    click.echo("\n".join(lines))
+    
+    # Check schedule
+    from ...scheduler import get_current_schedule, describe_schedule
+    
+    schedule = get_current_schedule()
+    if schedule:
+        schedule_line = f"   ✅ Auto-sync enabled: {describe_schedule(schedule)}"
+    else:
+        schedule_line = "   ⚠️ No auto-sync scheduled (manual only)"
+    click.echo(f"\n⏰ Schedule Status:\n{schedule_line}")
+    
+    return True
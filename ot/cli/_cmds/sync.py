@@ -0,0 +1,41 @@
+"""The ``ot sync`` command."""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import click
+
+from . import config_option
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@click.command()
+@config_option
+def sync(config: Path | None) -> None:
+    """Run the sync and push operation.
+    
+    This performs a complete backup cycle:
+    1. Pull remote changes
+    2. Wait for iCloud sync (if applicable)
+    3. Sync files with rsync
+    4. Commit and push to Git
+    """
+    from ...runner import run_sync
+    
+    result = run_sync(config_path=config)
+    
+    if not result.success:
+        if result.errors:
+            for error in result.errors:
+                click.echo(f"Error: {error}", err=True)
+        sys.exit(1)
+    
+    if result.warnings:
+        for warning in result.warnings:
+            click.echo(f"Warning: {warning}", err=True)
+    
+    click.echo("✅ Sync completed successfully!")
@@ -0,0 +1,21 @@
+"""The ``ot version`` command."""
+
+from __future__ import annotations
+
+import click
+
+
+@click.command()
+def version() -> None:
+    """Show detailed version information."""
+    from ...version import get_current_version, GITHUB_REPO_URL
+    
+    try:
+        ver = get_current_version()
+    except Exception:
+        ver = "unknown"
+    
+    click.echo(f"Obsidian Timemachine v{ver}")
+    click.echo(f"Repository: {GITHUB_REPO_URL}")
+    click.echo("")
+    click.echo("Use 'ot update --check' to check for available updates.")
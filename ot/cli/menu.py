@@ -6,13 +6,43 @@ Provides a TUI-style menu for common operations.
 
 from __future__ import annotations
 
+import heapq
+import os
+import shlex
 import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from ..config import load_config, ConfigError, DEFAULT_CONFIG_FILE
-from ..git_ops import get_remote_url, get_current_branch, is_git_repo
-from ..scheduler import get_current_schedule, describe_schedule
+if TYPE_CHECKING:
+    from ..config import Config
+
+
+# Menu header and options, styled once and written with a single echo
+_MENU_HEADER = "\n" + "".join(
+    click.style(line, fg="blue") + "\n"
+    for line in (
+        "╔══════════════════════════════════════════════════╗",
+        "║         Obsidian Timemachine - Menu              ║",
+        "╚══════════════════════════════════════════════════╝",
+    )
+) + "\n"
+
+_MENU_OPTIONS = click.style("─" * 50, fg="blue") + "\n\n" + "".join(
+    f"{line}\n"
+    for line in (
+        "  1. 🔄 Run Sync Now",
+        "  2. 📋 View Full Status",
+        "  3. ⏰ Manage Schedule",
+        "  4. ⚙️  Run Setup Wizard",
+        "  5. 📁 View Logs",
+        "  6. 🆕 Check for Updates",
+        "  7. ❌ Exit",
+    )
+) + "\n"
 
 
 def clear_screen() -> None:
@@ -22,55 +52,146 @@ def clear_screen() -> None:
 
 def print_header() -> None:
     """Print the menu header."""
-    click.echo()
-    click.echo(click.style("╔══════════════════════════════════════════════════╗", fg="blue"))
-    click.echo(click.style("║         Obsidian Timemachine - Menu              ║", fg="blue"))
-    click.echo(click.style("╚══════════════════════════════════════════════════╝", fg="blue"))
-    click.echo()
+    click.echo(_MENU_HEADER, nl=False)
 
 
-def print_status_summary() -> None:
-    """Print a brief status summary."""
+# Seconds a status snapshot is reused across menu redraws
+STATUS_CACHE_TTL = 30.0
+
+
+@dataclass
+class _StatusSnapshot:
+    """Values shown in the menu status summary.
+    
+    Attributes:
+        source_name: Name of the vault (source) directory.
+        is_repo: Whether the destination is a Git repository.
+        branch: Current branch of the destination repository.
+        remote: URL of the 'origin' remote, if configured.
+        schedule: Current auto-sync schedule, if any.
+    """
+    source_name: str
+    is_repo: bool
+    branch: str | None = None
+    remote: str | None = None
+    schedule: str | None = None
+
+
+# (monotonic time taken, config file mtime, snapshot or None if not configured)
+_status_cache: tuple[float, int | None, _StatusSnapshot | None] | None = None
+
+
+def _config_mtime() -> int | None:
+    """Get the default config file's mtime, or None if it cannot be read."""
+    from ..config import DEFAULT_CONFIG_FILE
+    
     try:
-        cfg = load_config(DEFAULT_CONFIG_FILE)
-        
-        click.echo(click.style("📊 Current Status:", bold=True))
-        click.echo(f"   Source: {cfg.source_dir.name}")
-        
-        if is_git_repo(cfg.dest_dir):
-            branch = get_current_branch(cfg.dest_dir) or "unknown"
-            remote = get_remote_url(cfg.dest_dir)
-            if remote:
-                # Extract repo name from URL
-                repo_name = remote.split("/")[-1].replace(".git", "")
-                click.echo(f"   Repo: {repo_name} ({branch})")
-            else:
-                click.echo(f"   Repo: local only ({branch})")
-        
-        schedule = get_current_schedule()
-        if schedule:
-            click.echo(f"   Schedule: {describe_schedule(schedule)}")
-        else:
-            click.echo("   Schedule: Manual only")
+        return os.stat(DEFAULT_CONFIG_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _take_status_snapshot(mtime: int | None) -> _StatusSnapshot | None:
+    """Collect the status summary values.
+    
+    Args:
+        mtime: Current mtime of the config file (from _config_mtime).
         
+    Returns:
+        Snapshot of the current status, or None if not configured.
+    """
+    if mtime is None:
+        return None
+    
+    from ..config import load_config, ConfigError, DEFAULT_CONFIG_FILE
+    
+    try:
+        cfg = load_config(DEFAULT_CONFIG_FILE)
     except ConfigError:
+        return None
+    
+    from ..git_ops import get_remote_url, get_current_branch, is_git_repo
+    from ..scheduler import get_current_schedule
+    
+    snapshot = _StatusSnapshot(
+        source_name=cfg.source_dir.name,
+        is_repo=is_git_repo(cfg.dest_dir),
+    )
+    if snapshot.is_repo:
+        snapshot.branch = get_current_branch(cfg.dest_dir)
+        snapshot.remote = get_remote_url(cfg.dest_dir)
+    snapshot.schedule = get_current_schedule()
+    
+    return snapshot
+
+
+def get_status_snapshot() -> _StatusSnapshot | None:
+    """Get the status snapshot, reusing a recent one if available.
+    
+    A snapshot is reused while it is younger than STATUS_CACHE_TTL and
+    the config file has not been modified since it was taken.
+    
+    Returns:
+        Snapshot of the current status, or None if not configured.
+    """
+    global _status_cache
+    
+    now = time.monotonic()
+    mtime = _config_mtime()
+    if (
+        _status_cache is not None
+        and _status_cache[1] == mtime
+        and now - _status_cache[0] < STATUS_CACHE_TTL
+    ):
+        return _status_cache[2]
+    
+    snapshot = _take_status_snapshot(mtime)
+    _status_cache = (now, mtime, snapshot)
+    return snapshot
+
+
+def invalidate_status_cache() -> None:
+    """Force the next status summary to re-read config, Git and schedule."""
+    global _status_cache
+    _status_cache = None
+
+
+def print_status_summary() -> None:
+    """Print a brief status summary."""
+    snapshot = get_status_snapshot()
+    
+    if snapshot is None:
         click.echo(click.style("   ⚠️ Not configured - run Setup first", fg="yellow"))
+        click.echo()
+        return
     
-    click.echo()
+    from ..scheduler import describe_schedule
+    
+    lines = [
+        click.style("📊 Current Status:", bold=True),
+        f"   Source: {snapshot.source_name}",
+    ]
+    
+    if snapshot.is_repo:
+        branch = snapshot.branch or "unknown"
+        if snapshot.remote:
+            # Extract repo name from URL
+            repo_name = snapshot.remote.split("/")[-1].replace(".git", "")
+            lines.append(f"   Repo: {repo_name} ({branch})")
+        else:
+            lines.append(f"   Repo: local only ({branch})")
+    
+    if snapshot.schedule:
+        lines.append(f"   Schedule: {describe_schedule(snapshot.schedule)}")
+    else:
+        lines.append("   Schedule: Manual only")
+    
+    click.echo("\n".join(lines) + "\n")
 
 
 def print_menu_options() -> None:
     """Print the menu options."""
-    click.echo(click.style("─" * 50, fg="blue"))
-    click.echo()
-    click.echo("  1. 🔄 Run Sync Now")
-    click.echo("  2. 📋 View Full Status")
-    click.echo("  3. ⏰ Manage Schedule")
-    click.echo("  4. ⚙️  Run Setup Wizard")
-    click.echo("  5. 📁 View Logs")
-    click.echo("  6. 🆕 Check for Updates")
-    click.echo("  7. ❌ Exit")
-    click.echo()
+    click.echo(_MENU_OPTIONS, nl=False)
 
 
 def handle_sync() -> None:
@@ -99,13 +220,10 @@ def handle_sync() -> None:
 
 def handle_status() -> None:
     """Handle viewing full status."""
-    from .main import status
+    from ._cmds.status import print_status
     
     click.echo()
-    
-    # Invoke status command
-    ctx = click.Context(status)
-    ctx.invoke(status)
+    print_status()
     
     click.echo()
     click.pause("Press any key to continue...")
@@ -113,6 +231,13 @@ def handle_status() -> None:
 
 def handle_schedule() -> None:
     """Handle schedule management submenu."""
+    from ..scheduler import (
+        add_sync_schedule,
+        describe_schedule,
+        get_current_schedule,
+        remove_sync_schedule,
+    )
+    
     while True:
         clear_screen()
         click.echo()
@@ -136,8 +261,6 @@ def handle_schedule() -> None:
         
         choice = click.prompt("Select option", type=int, default=6)
         
-        from ..scheduler import add_sync_schedule, remove_sync_schedule
-        
         if choice == 1:
             add_sync_schedule("15min")
             click.echo(click.style("✅ Schedule set to every 15 minutes", fg="green"))
@@ -160,6 +283,9 @@ def handle_schedule() -> None:
             click.pause()
         elif choice == 6:
             break
+    
+    # Schedule may have changed
+    invalidate_status_cache()
 
 
 def handle_setup() -> None:
@@ -168,9 +294,41 @@ def handle_setup() -> None:
     
     clear_screen()
     run_wizard()
+    invalidate_status_cache()
     click.pause("Press any key to continue...")
 
 
+def _read_tail_lines(path: Path, count: int, block_size: int = 16384) -> list[str]:
+    """Read the last lines of a file without loading all of it.
+    
+    Reads a window from the end of the file, doubling it until it holds
+    enough lines or covers the whole file.
+    
+    Args:
+        path: File to read.
+        count: Number of lines to return.
+        block_size: Initial window size in bytes.
+        
+    Returns:
+        Up to ``count`` last lines of the file.
+        
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with path.open("rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        window = block_size
+        while True:
+            back = min(size, window)
+            f.seek(size - back)
+            lines = f.read(back).decode("utf-8", errors="replace").splitlines()
+            # The first line may be cut off unless we started at offset 0
+            if back == size or len(lines) > count:
+                return lines[-count:]
+            window *= 2
+
+
 def handle_logs() -> None:
     """Handle viewing logs."""
     from ..config import DEFAULT_LOG_DIR
@@ -184,7 +342,12 @@ def handle_logs() -> None:
     if not log_dir.exists():
         click.echo("   No logs found yet.")
     else:
-        log_files = sorted(log_dir.glob("*.log"), reverse=True)[:5]
+        with os.scandir(log_dir) as it:
+            log_files = heapq.nlargest(
+                5,
+                (e for e in it if e.name.endswith(".log")),
+                key=lambda e: e.name,
+            )
         
         if not log_files:
             click.echo("   No log files found.")
@@ -203,7 +366,7 @@ def handle_logs() -> None:
                     click.echo(click.style(f"--- {log_files[0].name} ---", fg="cyan"))
                     try:
                         # Show last 30 lines
-                        lines = log_files[0].read_text().splitlines()[-30:]
+                        lines = _read_tail_lines(Path(log_files[0].path), 30)
                         for line in lines:
                             click.echo(line)
                     except OSError as e:
@@ -249,7 +412,7 @@ def handle_update() -> None:
         if click.confirm("Do you want to install the update?", default=True):
             click.echo()
             try:
-                if perform_update():
+                if perform_update(info=info):
                     click.echo()
                     click.echo(click.style("✅ Update completed!", fg="green"))
                     click.echo("   Please restart the application.")
@@ -257,7 +420,7 @@ def handle_update() -> None:
                     click.echo(click.style("❌ Update failed.", fg="red"))
             except UpdateError as e:
                 click.echo(click.style(f"❌ Update failed: {e}", fg="red"))
-                click.echo(f"   Manual update: {get_update_command()}")
+                click.echo(f"   Manual update: {shlex.join(get_update_command())}")
     
     click.echo()
     click.pause("Press any key to continue...")
@@ -6,6 +6,7 @@ Provides a guided setup experience for first-time configuration.
 
 from __future__ import annotations
 
+import os
 import re
 import sys
 from pathlib import Path
@@ -21,21 +22,83 @@ from ..config import (
     validate_config,
 )
 from ..git_ops import (
-    get_current_branch,
-    get_remote_url,
     init_repo,
-    is_git_repo,
+    probe_git,
     set_remote_url,
 )
-from ..ssh import find_ssh_keys, generate_ssh_key, SSHKey
+from ..ssh import (
+    describe_ssh_key,
+    generate_ssh_key,
+    key_type_from_name,
+    list_ssh_key_paths,
+)
+
+
+# Accepted remote URL prefixes: scp-style SSH, HTTP(S), or ssh://
+_GIT_URL_RE = re.compile(r"^(git@[\w.-]+:|https?://|ssh://)")
+
+# Common vault locations as (parent relative to home, leaf directory name)
+_ICLOUD_ROOT = os.path.join("Library", "Mobile Documents")
+_VAULT_CANDIDATES = (
+    (os.path.join(_ICLOUD_ROOT, "iCloud~md~obsidian"), "Documents"),
+    ("Documents", "Obsidian"),
+    ("", "Obsidian"),
+)
+
+
+def _find_vault_locations() -> list[str]:
+    """Find common Obsidian vault locations that exist.
+    
+    Each parent is checked once and listed with a single scandir, so
+    missing parents cost one stat. The iCloud candidate is skipped
+    entirely when ~/Library/Mobile Documents does not exist (non-Mac).
+    
+    Returns:
+        Paths of the candidate directories that exist.
+    """
+    home = os.path.expanduser("~")
+    has_icloud = os.path.isdir(os.path.join(home, _ICLOUD_ROOT))
+    
+    found = []
+    for parent, leaf in _VAULT_CANDIDATES:
+        if parent.startswith(_ICLOUD_ROOT) and not has_icloud:
+            continue
+        
+        parent = os.path.join(home, parent)
+        if not os.path.isdir(parent):
+            continue
+        
+        try:
+            with os.scandir(parent) as entries:
+                if any(e.name == leaf and e.is_dir() for e in entries):
+                    found.append(os.path.join(parent, leaf))
+        except OSError:
+            continue
+    
+    return found
+
+
+# Horizontal rules and title box, styled once at import
+_HR_BLUE = click.style("─" * 50, fg="blue")
+_HR_YELLOW = click.style("─" * 50, fg="yellow")
+_BANNER = "\n".join(
+    click.style(line, fg="blue")
+    for line in (
+        "╔════════════════════════════════════════════════╗",
+        "║   Obsidian Timemachine - Setup Wizard         ║",
+        "╚════════════════════════════════════════════════╝",
+    )
+)
 
 
 def print_header(text: str) -> None:
     """Print a section header."""
-    click.echo()
-    click.echo(click.style("─" * 50, fg="blue"))
-    click.echo(click.style(f"  {text}", fg="blue", bold=True))
-    click.echo(click.style("─" * 50, fg="blue"))
+    click.echo("\n".join([
+        "",
+        _HR_BLUE,
+        click.style(f"  {text}", fg="blue", bold=True),
+        _HR_BLUE,
+    ]))
 
 
 def print_success(text: str) -> None:
@@ -114,15 +177,8 @@ def setup_source_directory() -> Path:
     click.echo()
     
     # Try to detect common Obsidian locations
-    common_locations = [
-        Path.home() / "Library" / "Mobile Documents" / "iCloud~md~obsidian" / "Documents",
-        Path.home() / "Documents" / "Obsidian",
-        Path.home() / "Obsidian",
-    ]
-    
-    for loc in common_locations:
-        if loc.exists():
-            click.echo(f"💡 Found potential vault location: {loc}")
+    for loc in _find_vault_locations():
+        click.echo(f"💡 Found potential vault location: {loc}")
     
     click.echo()
     
@@ -145,27 +201,29 @@ def setup_dest_directory() -> Path:
         create_if_missing=True,
     )
     
+    is_repo, remote = probe_git(dest)
+    
     # Check if it's a Git repo, offer to initialize
-    if not is_git_repo(dest):
+    if not is_repo:
         print_warning("This directory is not a Git repository.")
         if click.confirm("Initialize as a Git repository?", default=True):
             result = init_repo(dest)
             if result.success:
                 print_success("Git repository initialized.")
+                is_repo = True
             else:
                 print_error(f"Failed to initialize: {result.error}")
     else:
         print_success("Git repository detected.")
         
         # Show current remote
-        remote = get_remote_url(dest)
         if remote:
             click.echo(f"   Remote: {remote}")
         else:
             print_warning("No remote 'origin' configured.")
     
     # Configure remote if needed
-    if is_git_repo(dest) and not get_remote_url(dest):
+    if is_repo and not remote:
         click.echo()
         click.echo("Configure a remote repository (e.g., GitHub)?")
         if click.confirm("Add remote origin?", default=True):
@@ -175,8 +233,7 @@ def setup_dest_directory() -> Path:
                     type=str,
                 )
                 # Validate URL format
-                git_url_pattern = r"^(git@[\w.-]+:|https?://|ssh://)"
-                if not re.match(git_url_pattern, remote_url):
+                if not _GIT_URL_RE.match(remote_url):
                     print_warning("URL format may be invalid. Expected git@, https://, or ssh://")
                     if not click.confirm("Use this URL anyway?", default=False):
                         continue
@@ -198,14 +255,14 @@ def setup_ssh_key() -> Path | None:
     click.echo("An SSH key is needed for pushing to GitHub/GitLab.")
     click.echo()
     
-    # Find existing keys
-    existing_keys = find_ssh_keys()
+    # Find existing keys; only the chosen one is inspected further
+    existing_keys = list_ssh_key_paths()
     
     if existing_keys:
         click.echo("Found existing SSH keys:")
-        for i, key in enumerate(existing_keys, 1):
-            key_type = key.key_type or "unknown"
-            click.echo(f"  {i}. {key.private_key_path} ({key_type})")
+        for i, key_path in enumerate(existing_keys, 1):
+            key_type = key_type_from_name(key_path.name) or "unknown"
+            click.echo(f"  {i}. {key_path} ({key_type})")
         
         click.echo(f"  {len(existing_keys) + 1}. Enter another path")
         click.echo(f"  {len(existing_keys) + 2}. Generate a new key")
@@ -218,7 +275,7 @@ def setup_ssh_key() -> Path | None:
         )
         
         if 1 <= choice <= len(existing_keys):
-            selected = existing_keys[choice - 1]
+            selected = describe_ssh_key(existing_keys[choice - 1])
             print_success(f"Using: {selected.private_key_path}")
             return selected.private_key_path
         
@@ -266,9 +323,9 @@ def _generate_new_key() -> Path | None:
         public_content = key.get_public_key_content()
         if public_content:
             click.echo()
-            click.echo(click.style("─" * 50, fg="yellow"))
+            click.echo(_HR_YELLOW)
             click.echo(click.style("IMPORTANT: Add this public key to GitHub", fg="yellow", bold=True))
-            click.echo(click.style("─" * 50, fg="yellow"))
+            click.echo(_HR_YELLOW)
             click.echo("1. Go to https://github.com/settings/keys")
             click.echo("2. Click 'New SSH key'")
             click.echo("3. Paste the following key:")
@@ -316,9 +373,7 @@ def run_wizard() -> Config | None:
         Config object if successful, None otherwise.
     """
     click.echo()
-    click.echo(click.style("╔════════════════════════════════════════════════╗", fg="blue"))
-    click.echo(click.style("║   Obsidian Timemachine - Setup Wizard         ║", fg="blue"))
-    click.echo(click.style("╚════════════════════════════════════════════════╝", fg="blue"))
+    click.echo(_BANNER)
     click.echo()
     click.echo("This wizard will help you configure automatic backup")
     click.echo("for your Obsidian vault.")
@@ -6,22 +6,28 @@ Handles loading, saving, and validating configuration from YAML files.
 
 from __future__ import annotations
 
+import functools
 import os
-from dataclasses import dataclass, field
+import stat
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 
 # Default configuration paths
 DEFAULT_CONFIG_DIR = Path.home() / ".config" / "ot"
 DEFAULT_CONFIG_FILE = DEFAULT_CONFIG_DIR / "config.yaml"
 DEFAULT_LOG_DIR = Path.home() / ".local" / "share" / "ot" / "logs"
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ot"
+)
 DEFAULT_LOG_RETENTION_DAYS = 7
 DEFAULT_ICLOUD_WAIT_TIMEOUT = 120  # seconds
 DEFAULT_RSYNC_DELETE = True  # Safe because Git preserves history
 
+# Config fields that may be given as strings and are stored as Paths
+_PATH_FIELDS = ("source_dir", "dest_dir", "log_dir", "ssh_key_path")
+
 
 @dataclass
 class Config:
@@ -45,15 +51,20 @@ class Config:
     rsync_delete: bool = DEFAULT_RSYNC_DELETE
     
     def __post_init__(self) -> None:
-        """Convert string paths to Path objects."""
-        if isinstance(self.source_dir, str):
-            self.source_dir = Path(self.source_dir).expanduser().resolve()
-        if isinstance(self.dest_dir, str):
-            self.dest_dir = Path(self.dest_dir).expanduser().resolve()
-        if isinstance(self.log_dir, str):
-            self.log_dir = Path(self.log_dir).expanduser().resolve()
-        if isinstance(self.ssh_key_path, str):
-            self.ssh_key_path = Path(self.ssh_key_path).expanduser().resolve()
+        """Convert string paths to absolute Path objects.
+        
+        Strings are expanded (~) and made absolute but not resolved;
+        callers that need symlinks resolved should call .resolve().
+        """
+        for name in _PATH_FIELDS:
+            value = getattr(self, name)
+            if not isinstance(value, str):
+                continue
+            if "~" in value:
+                value = os.path.expanduser(value)
+            if not os.path.isabs(value):
+                value = os.path.abspath(value)
+            setattr(self, name, Path(value))
     
     def to_dict(self) -> dict[str, Any]:
         """Convert config to dictionary for serialization."""
@@ -73,9 +84,35 @@ class ConfigError(Exception):
     pass
 
 
+# Parsed configs by resolved path: (st_mtime_ns, st_size, config)
+_CONFIG_CACHE: dict[Path, tuple[int, int, Config]] = {}
+
+
+@functools.cache
+def _yaml_codec() -> tuple[Any, type, type]:
+    """Import PyYAML and pick its fastest safe loader and dumper.
+    
+    Imported on first use so a missing config never pays for the YAML
+    parser. The LibYAML-backed classes are only present when PyYAML was
+    built against libyaml; otherwise the pure-Python ones are used.
+    
+    Returns:
+        Tuple of (yaml module, loader class, dumper class).
+    """
+    import yaml
+    
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml, loader, dumper
+
+
 def load_config(config_path: Path | None = None) -> Config:
     """Load configuration from a YAML file.
     
+    Parsed configs are cached per process and reused while the file's
+    mtime and size are unchanged; each call returns its own copy. Set
+    OT_CONFIG_NOCACHE=1 to always re-read the file.
+    
     Args:
         config_path: Path to the config file. Defaults to ~/.config/ot/config.yaml
         
@@ -90,12 +127,25 @@ def load_config(config_path: Path | None = None) -> Config:
     
     config_path = Path(config_path).expanduser().resolve()
     
-    if not config_path.exists():
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
         raise ConfigError(f"Configuration file not found: {config_path}")
+    except OSError as e:
+        raise ConfigError(f"Cannot read config file: {e}")
+    
+    use_cache = not os.environ.get("OT_CONFIG_NOCACHE")
+    if use_cache:
+        cached = _CONFIG_CACHE.get(config_path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return replace(cached[2])
+    
+    yaml, loader, _ = _yaml_codec()
     
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            text = f.read()
+        data = yaml.load(text, Loader=loader) or {}
     except yaml.YAMLError as e:
         raise ConfigError(f"Invalid YAML in config file: {e}")
     except OSError as e:
@@ -107,7 +157,7 @@ def load_config(config_path: Path | None = None) -> Config:
         if field_name not in data:
             raise ConfigError(f"Missing required field: {field_name}")
     
-    return Config(
+    config = Config(
         source_dir=data["source_dir"],
         dest_dir=data["dest_dir"],
         log_dir=data.get("log_dir", DEFAULT_LOG_DIR),
@@ -116,6 +166,11 @@ def load_config(config_path: Path | None = None) -> Config:
         icloud_wait_timeout=data.get("icloud_wait_timeout", DEFAULT_ICLOUD_WAIT_TIMEOUT),
         rsync_delete=data.get("rsync_delete", DEFAULT_RSYNC_DELETE),
     )
+    
+    if use_cache:
+        _CONFIG_CACHE[config_path] = (st.st_mtime_ns, st.st_size, config)
+        return replace(config)
+    return config
 
 
 def save_config(config: Config, config_path: Path | None = None) -> None:
@@ -136,23 +191,40 @@ def save_config(config: Config, config_path: Path | None = None) -> None:
     # Ensure parent directory exists
     config_path.parent.mkdir(parents=True, exist_ok=True)
     
+    yaml, _, dumper = _yaml_codec()
+    
+    # Write a private temp file and rename it over the target, so readers
+    # never see a partial file or one with looser permissions
+    tmp_path = config_path.with_name(config_path.name + ".tmp")
+    
     try:
-        with open(config_path, "w", encoding="utf-8") as f:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            # A stale temp file keeps its old mode through O_TRUNC
+            try:
+                os.fchmod(f.fileno(), 0o600)
+            except (AttributeError, OSError):
+                pass  # Best effort, may fail on some file systems
+            
             yaml.dump(
                 config.to_dict(),
                 f,
+                Dumper=dumper,
                 default_flow_style=False,
                 allow_unicode=True,
                 sort_keys=False,
             )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, config_path)
     except OSError as e:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
         raise ConfigError(f"Cannot write config file: {e}")
-    
-    # Set secure file permissions (owner read/write only)
-    try:
-        os.chmod(config_path, 0o600)
-    except OSError:
-        pass  # Best effort, may fail on some file systems
+    finally:
+        _CONFIG_CACHE.pop(config_path, None)
 
 
 class ConfigValidationError(Exception):
@@ -163,6 +235,22 @@ class ConfigValidationError(Exception):
         super().__init__(f"Configuration validation failed: {'; '.join(errors)}")
 
 
+def _probe(path: Path) -> tuple[bool, bool, bool]:
+    """Stat a path once.
+    
+    Args:
+        path: Path to check.
+        
+    Returns:
+        Tuple of (exists, is_dir, is_file).
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return False, False, False
+    return True, stat.S_ISDIR(mode), stat.S_ISREG(mode)
+
+
 def validate_config(config: Config) -> list[str]:
     """Validate configuration values.
     
@@ -177,24 +265,27 @@ def validate_config(config: Config) -> list[str]:
     errors: list[str] = []
     
     # Check source directory exists
-    if not config.source_dir.exists():
+    exists, is_dir, _ = _probe(config.source_dir)
+    if not exists:
         errors.append(f"Source directory does not exist: {config.source_dir}")
-    elif not config.source_dir.is_dir():
+    elif not is_dir:
         errors.append(f"Source path is not a directory: {config.source_dir}")
     
     # Check destination directory exists
-    if not config.dest_dir.exists():
+    exists, is_dir, _ = _probe(config.dest_dir)
+    if not exists:
         errors.append(f"Destination directory does not exist: {config.dest_dir}")
-    elif not config.dest_dir.is_dir():
+    elif not is_dir:
         errors.append(f"Destination path is not a directory: {config.dest_dir}")
     elif not os.access(config.dest_dir, os.W_OK):
         errors.append(f"No write permission for destination: {config.dest_dir}")
     
     # Check SSH key if specified
     if config.ssh_key_path:
-        if not config.ssh_key_path.exists():
+        exists, _, is_file = _probe(config.ssh_key_path)
+        if not exists:
             errors.append(f"SSH key file does not exist: {config.ssh_key_path}")
-        elif not config.ssh_key_path.is_file():
+        elif not is_file:
             errors.append(f"SSH key path is not a file: {config.ssh_key_path}")
     
     # Check log retention days is positive
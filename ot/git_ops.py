@@ -7,11 +7,15 @@ fetch, merge, commit, and push operations.
 
 from __future__ import annotations
 
+import functools
 import os
+import re
 import shlex
 import shutil
 import subprocess
+import threading
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
@@ -22,16 +26,29 @@ from .logger import get_logger
 class GitResult:
     """Result of a Git operation.
     
+    Output is kept as bytes and only decoded if a caller reads the
+    output/error text, which most callers never do.
+    
     Attributes:
         success: Whether the operation succeeded.
-        output: Combined stdout output.
-        error: Error message if failed.
+        stdout: Raw stdout bytes.
+        stderr: Raw stderr bytes (or error message if git could not run).
         exit_code: Git command exit code.
     """
     success: bool
-    output: str
-    error: str
+    stdout: bytes
+    stderr: bytes
     exit_code: int
+    
+    @functools.cached_property
+    def output(self) -> str:
+        """Stdout decoded as UTF-8."""
+        return self.stdout.decode("utf-8", "replace")
+    
+    @functools.cached_property
+    def error(self) -> str:
+        """Stderr decoded as UTF-8."""
+        return self.stderr.decode("utf-8", "replace")
 
 
 class GitError(Exception):
@@ -42,6 +59,121 @@ class GitError(Exception):
         super().__init__(message)
 
 
+# Conflict markers in 'git merge' output, matched in a single scan
+_CONFLICT_RE = re.compile(rb"^CONFLICT \(|^Automatic merge failed", re.MULTILINE)
+
+# Open GitBatch processes by repository path (see GitBatch)
+_active_batches: dict[str, GitBatch] = {}
+
+
+class GitBatch:
+    """A long-running 'git cat-file --batch-check' for resolving revisions.
+    
+    While a batch is open for a repository, has_commits and pull resolve
+    revisions through it instead of spawning 'git rev-parse' each time.
+    If the process cannot be started or dies, lookups fall back to
+    one-shot git commands.
+    
+    Example:
+        with GitBatch(repo_path):
+            has_commits(repo_path)  # no new process
+    """
+    
+    def __init__(self, repo_path: Path):
+        """Initialize the batch.
+        
+        Args:
+            repo_path: Path to the Git repository.
+        """
+        self.repo_path = repo_path
+        self._proc: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+    
+    def __enter__(self) -> GitBatch:
+        try:
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", "--batch-check=%(objectname)"],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            self._proc = None
+        else:
+            _active_batches[str(self.repo_path)] = self
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Stop the cat-file process."""
+        if _active_batches.get(str(self.repo_path)) is self:
+            del _active_batches[str(self.repo_path)]
+        
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+        proc.stdout.close()
+    
+    def resolve(self, rev: str) -> str | None:
+        """Resolve a revision to an object name.
+        
+        Args:
+            rev: Revision to resolve (e.g. "HEAD", "origin/main").
+            
+        Returns:
+            Object name, or None if the revision does not exist.
+            
+        Raises:
+            GitError: If the cat-file process is not running.
+        """
+        with self._lock:
+            if self._proc is None:
+                raise GitError("git cat-file is not running")
+            try:
+                self._proc.stdin.write(rev.encode() + b"\n")
+                self._proc.stdin.flush()
+                line = self._proc.stdout.readline()
+            except OSError as e:
+                raise GitError(f"git cat-file failed: {e}")
+        
+        if not line:
+            raise GitError("git cat-file exited unexpectedly")
+        
+        # Unknown revisions are echoed back as "<rev> missing" / "<rev> ambiguous"
+        line = line.strip()
+        if b" " in line:
+            return None
+        return line.decode()
+
+
+def _resolve_revs(repo_path: Path, *revs: str) -> list[str | None] | None:
+    """Resolve revisions through an open GitBatch for the repository.
+    
+    Args:
+        repo_path: Path to the Git repository.
+        *revs: Revisions to resolve.
+        
+    Returns:
+        Object name (or None if missing) per revision, or None if no
+        batch is open or it failed (callers then run git directly).
+    """
+    batch = _active_batches.get(str(repo_path))
+    if batch is None:
+        return None
+    try:
+        return [batch.resolve(rev) for rev in revs]
+    except GitError:
+        return None
+
+
 def check_git_available() -> bool:
     """Check if git is available on the system.
     
@@ -51,6 +183,30 @@ def check_git_available() -> bool:
     return shutil.which("git") is not None
 
 
+@functools.lru_cache(maxsize=4)
+def _make_env(ssh_key_path: str | None) -> tuple[tuple[str, str], ...]:
+    """Build the environment variables git runs with on top of os.environ.
+    
+    Cached per key path, so the key is only resolved once per process.
+    
+    Args:
+        ssh_key_path: Path to SSH private key for authentication.
+        
+    Returns:
+        Tuple of (name, value) pairs to overlay on the environment.
+    """
+    # Ensure consistent locale
+    overlay = [("LC_ALL", "en_US.UTF-8")]
+    
+    # Configure SSH command if key path is provided
+    if ssh_key_path:
+        resolved = Path(ssh_key_path).expanduser().resolve()
+        quoted_path = shlex.quote(str(resolved))
+        overlay.append(("GIT_SSH_COMMAND", f"ssh -i {quoted_path} -o IdentitiesOnly=yes"))
+    
+    return tuple(overlay)
+
+
 def _run_git(
     args: list[str],
     cwd: Path,
@@ -70,51 +226,90 @@ def _run_git(
     """
     cmd = ["git"] + args
     
-    env = os.environ.copy()
-    
-    # Configure SSH command if key path is provided
-    if ssh_key_path:
-        ssh_key_path = Path(ssh_key_path).expanduser().resolve()
-        quoted_path = shlex.quote(str(ssh_key_path))
-        env["GIT_SSH_COMMAND"] = f"ssh -i {quoted_path} -o IdentitiesOnly=yes"
-    
-    # Ensure consistent locale
-    env["LC_ALL"] = "en_US.UTF-8"
+    env = {**os.environ, **dict(_make_env(str(ssh_key_path) if ssh_key_path else None))}
     
     try:
         result = subprocess.run(
             cmd,
             cwd=cwd,
             capture_output=True,
-            text=True,
             env=env,
             timeout=timeout,
         )
         
         return GitResult(
             success=result.returncode == 0,
-            output=result.stdout,
-            error=result.stderr,
+            stdout=result.stdout,
+            stderr=result.stderr,
             exit_code=result.returncode,
         )
     
     except subprocess.TimeoutExpired:
         return GitResult(
             success=False,
-            output="",
-            error=f"Git command timed out after {timeout}s",
+            stdout=b"",
+            stderr=f"Git command timed out after {timeout}s".encode(),
             exit_code=-1,
         )
     
     except OSError as e:
         return GitResult(
             success=False,
-            output="",
-            error=str(e),
+            stdout=b"",
+            stderr=str(e).encode(),
             exit_code=-1,
         )
 
 
+# Open pygit2 repositories by path, reused for the life of the process
+_repo_cache: dict[str, Any] = {}
+
+
+def _pygit2() -> Any | None:
+    """Import the optional pygit2 binding.
+    
+    Returns:
+        The pygit2 module, or None if it is not installed.
+    """
+    try:
+        import pygit2
+    except ImportError:
+        return None
+    return pygit2
+
+
+def _open_repo(repo_path: Path) -> Any | None:
+    """Open a repository in-process with pygit2, if available.
+    
+    Read-only queries use this to avoid spawning git. Anything that
+    writes to the repository or talks to a remote still goes through
+    _run_git, so hooks, credentials and SSH options behave as before.
+    
+    Args:
+        repo_path: Path to the Git repository.
+        
+    Returns:
+        pygit2.Repository, or None if pygit2 is not installed or the
+        path cannot be opened (callers then fall back to _run_git).
+    """
+    key = str(repo_path)
+    repo = _repo_cache.get(key)
+    if repo is not None:
+        return repo
+    
+    pygit2 = _pygit2()
+    if pygit2 is None:
+        return None
+    
+    try:
+        repo = pygit2.Repository(key)
+    except (pygit2.GitError, KeyError, OSError):
+        return None
+    
+    _repo_cache[key] = repo
+    return repo
+
+
 def is_git_repo(path: Path) -> bool:
     """Check if a directory is a Git repository.
     
@@ -165,6 +360,13 @@ def get_current_branch(repo_path: Path) -> str | None:
     Returns:
         Branch name, or None if detection fails.
     """
+    repo = _open_repo(repo_path)
+    if repo is not None:
+        head = repo.references.get("HEAD")
+        target = head.target if head is not None else None
+        if isinstance(target, str) and target.startswith("refs/heads/"):
+            return target[len("refs/heads/"):]
+    
     result = _run_git(["branch", "--show-current"], cwd=repo_path)
     
     if result.success and result.output.strip():
@@ -189,6 +391,13 @@ def get_remote_url(repo_path: Path, remote: str = "origin") -> str | None:
     Returns:
         Remote URL, or None if not configured.
     """
+    repo = _open_repo(repo_path)
+    if repo is not None:
+        try:
+            return repo.remotes[remote].url
+        except KeyError:
+            return None
+    
     result = _run_git(["remote", "get-url", remote], cwd=repo_path)
     
     if result.success:
@@ -197,6 +406,34 @@ def get_remote_url(repo_path: Path, remote: str = "origin") -> str | None:
     return None
 
 
+def probe_git(path: Path, remote: str = "origin") -> tuple[bool, str | None]:
+    """Check whether a directory is a Git repository and get its remote URL.
+    
+    Uses the same .git check as is_git_repo (no subprocess) and at most
+    one git invocation to read the remote, so callers that need both
+    facts do not spawn git repeatedly.
+    
+    Args:
+        path: Directory path to check.
+        remote: Remote name (default: "origin").
+        
+    Returns:
+        Tuple of (is_repo, remote_url). remote_url is None if the
+        directory is not a repository or the remote is not configured.
+    """
+    path = Path(path).expanduser().resolve()
+    if not is_git_repo(path):
+        return False, None
+    
+    # Exit code 1 means the key is unset; 128 means git could not read the repo
+    result = _run_git(["config", "--get", f"remote.{remote}.url"], cwd=path)
+    
+    if result.success and result.output.strip():
+        return True, result.output.strip()
+    
+    return True, None
+
+
 def set_remote_url(
     repo_path: Path,
     url: str,
@@ -232,6 +469,14 @@ def has_commits(repo_path: Path) -> bool:
     Returns:
         True if there are commits, False otherwise.
     """
+    repo = _open_repo(repo_path)
+    if repo is not None:
+        return not repo.head_is_unborn
+    
+    resolved = _resolve_revs(repo_path, "HEAD")
+    if resolved is not None:
+        return resolved[0] is not None
+    
     result = _run_git(["rev-parse", "HEAD"], cwd=repo_path)
     return result.success
 
@@ -245,8 +490,15 @@ def has_changes(repo_path: Path) -> bool:
     Returns:
         True if there are changes, False otherwise.
     """
-    result = _run_git(["status", "-s"], cwd=repo_path)
-    return result.success and bool(result.output.strip())
+    repo = _open_repo(repo_path)
+    if repo is not None:
+        return bool(repo.status())
+    
+    # Porcelain output is empty exactly when the tree is clean, so the raw
+    # bytes are tested without decoding. Untracked files must count, and
+    # status refreshes stale index stat data that diff-index would report.
+    result = _run_git(["status", "--porcelain", "-z"], cwd=repo_path)
+    return result.success and bool(result.stdout)
 
 
 def fetch(
@@ -309,9 +561,8 @@ def merge(
     if result.success:
         logger.info("✅ Merge completed.")
     else:
-        # Check for merge conflicts
-        status_result = _run_git(["status"], cwd=repo_path)
-        if "Unmerged paths" in status_result.output or "both modified" in status_result.output:
+        # Check for merge conflicts (git merge reports them on stdout)
+        if _CONFLICT_RE.search(result.stdout):
             logger.error("❌ Merge conflict detected! Manual resolution required.")
             # Abort the merge to leave repo in clean state
             _run_git(["merge", "--abort"], cwd=repo_path)
@@ -353,26 +604,63 @@ def pull(
         logger.warning("⚠️ Fetch failed; proceeding with local sync only.")
         return fetch_result
     
-    # Check if we're up to date
-    local_result = _run_git(["rev-parse", "HEAD"], cwd=repo_path)
-    remote_result = _run_git(["rev-parse", f"{remote}/{branch}"], cwd=repo_path)
+    # Fast path: a clean tree that is behind or level with the remote is
+    # fast-forwarded in one spawn. 'merge' rather than 'pull' ignores the
+    # user's pull.rebase and pull.ff settings.
+    if not has_changes(repo_path):
+        ff_result = _run_git(["merge", "--ff-only", "FETCH_HEAD"], cwd=repo_path)
+        
+        if ff_result.success:
+            logger.info(f"✅ Up-to-date with {remote}/{branch}.")
+            return ff_result
+        
+        # Diverged from the remote; compare the heads and merge below
     
-    if not local_result.success:
-        # No local commits yet, skip merge
-        logger.info("No local commits yet; skipping merge.")
-        return GitResult(success=True, output="", error="", exit_code=0)
+    return _merge_if_behind(repo_path, remote, branch)
+
+
+def _merge_if_behind(repo_path: Path, remote: str, branch: str) -> GitResult:
+    """Merge an already-fetched remote branch if it differs from HEAD.
     
-    if not remote_result.success:
-        # Remote branch doesn't exist yet
-        logger.info("Remote branch doesn't exist yet; skipping merge.")
-        return GitResult(success=True, output="", error="", exit_code=0)
+    Args:
+        repo_path: Path to the Git repository.
+        remote: Remote name.
+        branch: Branch to merge.
+        
+    Returns:
+        GitResult with operation status.
+    """
+    logger = get_logger()
     
-    local_commit = local_result.output.strip()
-    remote_commit = remote_result.output.strip()
+    # Check if we're up to date (both heads in one call when both exist)
+    heads = _resolve_revs(repo_path, "HEAD", f"{remote}/{branch}")
+    if heads is None:
+        heads_result = _run_git(["rev-parse", "HEAD", f"{remote}/{branch}"], cwd=repo_path)
+        heads = heads_result.output.split() if heads_result.success else []
+    
+    if len(heads) == 2 and None not in heads:
+        local_commit, remote_commit = heads
+    else:
+        # One of the refs is missing; find out which
+        local_result = _run_git(["rev-parse", "HEAD"], cwd=repo_path)
+        remote_result = _run_git(["rev-parse", f"{remote}/{branch}"], cwd=repo_path)
+        
+        if not local_result.success:
+            # No local commits yet, skip merge
+            logger.info("No local commits yet; skipping merge.")
+            return GitResult(success=True, stdout=b"", stderr=b"", exit_code=0)
+        
+        if not remote_result.success:
+            # Remote branch doesn't exist yet
+            logger.info("Remote branch doesn't exist yet; skipping merge.")
+            return GitResult(success=True, stdout=b"", stderr=b"", exit_code=0)
+        
+        local_commit = local_result.output.strip()
+        remote_commit = remote_result.output.strip()
     
     if local_commit == remote_commit:
         logger.info("✅ Already up-to-date with remote.")
-        return GitResult(success=True, output="Already up-to-date", error="", exit_code=0)
+        return GitResult(success=True, stdout=b"Already up-to-date", stderr=b"", exit_code=0)
     
     # Merge remote changes
     return merge(repo_path, f"{remote}/{branch}")
@@ -404,17 +692,17 @@ def commit(
         GitResult with operation status.
     """
     logger = get_logger()
+    logger.info("📝 Committing changes...")
+    
+    result = _run_git(["commit", "-m", message], cwd=repo_path)
     
-    # Ensure Git user is configured (required for commit)
-    user_email = _run_git(["config", "user.email"], cwd=repo_path)
-    if not user_email.success or not user_email.output.strip():
+    # Git refuses to commit without an identity; set a default for this
+    # repository only when that happens, then retry once
+    if not result.success and _is_missing_identity(result.stderr):
         logger.info("⚙️ Configuring default Git user for this repository...")
         _run_git(["config", "user.email", "obsidian-timemachine@local"], cwd=repo_path)
         _run_git(["config", "user.name", "Obsidian Timemachine"], cwd=repo_path)
-    
-    logger.info("📝 Committing changes...")
-    
-    result = _run_git(["commit", "-m", message], cwd=repo_path)
+        result = _run_git(["commit", "-m", message], cwd=repo_path)
     
     if result.success:
         logger.info("✅ Commit successful.")
@@ -424,6 +712,22 @@ def commit(
     return result
 
 
+def _is_missing_identity(error: bytes) -> bool:
+    """Check whether git failed because no user name/email is configured.
+    
+    Args:
+        error: Stderr of the failed git command.
+        
+    Returns:
+        True if the failure was a missing committer identity.
+    """
+    return (
+        b"Please tell me who you are" in error
+        or b"unable to auto-detect email address" in error
+        or b"empty ident name" in error
+    )
+
+
 def push(
     repo_path: Path,
     remote: str = "origin",
@@ -476,6 +780,7 @@ def commit_and_push(
     remote: str = "origin",
     branch: str | None = None,
     ssh_key_path: Path | None = None,
+    is_first_push: bool | None = None,
 ) -> GitResult:
     """Stage, commit, and push all changes.
     
@@ -485,6 +790,8 @@ def commit_and_push(
         remote: Remote name.
         branch: Branch to push.
         ssh_key_path: SSH key for authentication.
+        is_first_push: Whether to set upstream tracking on push
+            (detected from the repository if None).
         
     Returns:
         GitResult with operation status.
@@ -494,7 +801,7 @@ def commit_and_push(
     # Check for changes
     if not has_changes(repo_path):
         logger.info("☕ No changes to commit.")
-        return GitResult(success=True, output="No changes", error="", exit_code=0)
+        return GitResult(success=True, stdout=b"No changes", stderr=b"", exit_code=0)
     
     logger.info("📝 Changes detected; preparing to commit...")
     
@@ -505,8 +812,7 @@ def commit_and_push(
     
     # Generate commit message if not provided
     if message is None:
-        from datetime import datetime
-        message = f"Auto-save: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+        message = f"Auto-save: {datetime.now():%Y-%m-%d %H:%M}"
     
     # Commit
     commit_result = commit(repo_path, message)
@@ -515,7 +821,8 @@ def commit_and_push(
     
     # Push
     # Determine if this is the first push (set upstream)
-    is_first_push = not has_commits(repo_path) or get_remote_url(repo_path) is None
+    if is_first_push is None:
+        is_first_push = not has_commits(repo_path) or get_remote_url(repo_path) is None
     
     return push(
         repo_path,
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -17,10 +18,16 @@ from typing import TextIO
 # Module-level logger
 _logger: logging.Logger | None = None
 
+# Log directories already restricted to owner access in this process
+_secured_dirs: set[Path] = set()
+
 # Log format
 LOG_FORMAT = "[%(asctime)s] %(levelname)s - %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Daily log file names, as written by get_log_file_path
+_LOG_NAME_RE = re.compile(r"backup-(\d{4}-\d{2}-\d{2})\.log")
+
 
 class ColoredFormatter(logging.Formatter):
     """Formatter that adds color codes for terminal output."""
@@ -34,11 +41,24 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Checked once; stdout does not change terminals mid-run
+        self._use_color = sys.stdout.isatty()
+    
+    def set_color(self, enabled: bool) -> None:
+        """Turn color codes on or off regardless of the terminal.
+        
+        Args:
+            enabled: Whether to add color codes.
+        """
+        self._use_color = enabled
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with color codes."""
-        color = self.COLORS.get(record.levelno, "")
         formatted = super().format(record)
-        if color and sys.stdout.isatty():
+        color = self.COLORS.get(record.levelno, "")
+        if color and self._use_color:
             return f"{color}{formatted}{self.RESET}"
         return formatted
 
@@ -80,11 +100,13 @@ def setup_logging(
     log_dir = Path(log_dir).expanduser().resolve()
     log_dir.mkdir(parents=True, exist_ok=True)
     
-    # Set secure directory permissions (owner access only)
-    try:
-        os.chmod(log_dir, 0o700)
-    except OSError:
-        pass  # Best effort, may fail on some file systems
+    # Set secure directory permissions (owner access only), once per process
+    if log_dir not in _secured_dirs:
+        try:
+            os.chmod(log_dir, 0o700)
+            _secured_dirs.add(log_dir)
+        except OSError:
+            pass  # Best effort, may fail on some file systems
     
     # Create or get logger
     logger = logging.getLogger("obsidian_timemachine")
@@ -93,9 +115,9 @@ def setup_logging(
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
     
-    # File handler - plain text format
+    # File handler - plain text format, opened on the first record
     log_file = get_log_file_path(log_dir)
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    file_handler = logging.FileHandler(log_file, encoding="utf-8", delay=True)
     file_handler.setLevel(level)
     file_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
     logger.addHandler(file_handler)
@@ -144,23 +166,27 @@ def rotate_logs(log_dir: Path, retention_days: int) -> int:
     """
     log_dir = Path(log_dir).expanduser().resolve()
     
-    if not log_dir.exists():
-        return 0
-    
-    cutoff_date = datetime.now() - timedelta(days=retention_days)
+    # ISO dates sort as strings, so names can be compared without parsing.
+    # A log dated on the cutoff day started before the cutoff time.
+    cutoff = f"{datetime.now() - timedelta(days=retention_days):%Y-%m-%d}"
     deleted_count = 0
     
-    for log_file in log_dir.glob("backup-*.log"):
-        try:
+    try:
+        entries = os.scandir(log_dir)
+    except OSError:
+        return 0
+    
+    with entries:
+        for entry in entries:
             # Extract date from filename: backup-YYYY-MM-DD.log
-            date_str = log_file.stem.replace("backup-", "")
-            file_date = datetime.strptime(date_str, "%Y-%m-%d")
-            
-            if file_date < cutoff_date:
-                log_file.unlink()
+            match = _LOG_NAME_RE.fullmatch(entry.name)
+            if match is None or match.group(1) > cutoff:
+                continue
+            try:
+                os.unlink(entry.path)
                 deleted_count += 1
-        except (ValueError, OSError):
-            # Skip files with invalid date format or that can't be deleted
-            continue
+            except OSError:
+                # Skip files that can't be deleted
+                continue
     
     return deleted_count
@@ -7,6 +7,7 @@ Orchestrates the complete backup workflow: iCloud wait, rsync, Git operations.
 from __future__ import annotations
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -14,8 +15,11 @@ from typing import Callable
 
 from .config import Config, ConfigError, load_config, validate_config
 from .git_ops import (
+    GitBatch,
     GitResult,
     commit_and_push,
+    get_current_branch,
+    get_remote_url,
     has_commits,
     is_git_repo,
     pull,
@@ -43,6 +47,20 @@ class SyncResult:
     warnings: list[str] | None = None
 
 
+@dataclass
+class _GitState:
+    """Repository facts gathered once per run.
+    
+    Attributes:
+        branch: Current branch of the destination repository.
+        remote_url: URL of the 'origin' remote, if configured.
+        has_commits: Whether the repository had commits before this run.
+    """
+    branch: str
+    remote_url: str | None
+    has_commits: bool
+
+
 class SyncRunner:
     """Orchestrates the backup workflow.
     
@@ -70,6 +88,7 @@ class SyncRunner:
         self._logger = None
         self._errors: list[str] = []
         self._warnings: list[str] = []
+        self._git: _GitState | None = None
     
     @property
     def config(self) -> Config:
@@ -119,6 +138,41 @@ class SyncRunner:
         
         return True
     
+    def _probe_git(self) -> _GitState:
+        """Read the branch, remote and commit state of the destination.
+        
+        None of these change during a run, so they are looked up once
+        and passed to the Git helpers instead of being re-detected.
+        
+        Returns:
+            _GitState for the destination repository.
+        """
+        dest = self.config.dest_dir
+        return _GitState(
+            branch=get_current_branch(dest) or "main",
+            remote_url=get_remote_url(dest),
+            has_commits=has_commits(dest),
+        )
+    
+    def _pull(self) -> GitResult:
+        """Fetch and merge remote updates into the destination.
+        
+        Returns:
+            GitResult of the pull.
+        """
+        logger = get_logger()
+        
+        if self._git.remote_url is None:
+            logger.info("No remote configured; skipping pull.")
+            return GitResult(success=True, stdout=b"", stderr=b"", exit_code=0)
+        
+        logger.info("🔄 Checking remote updates...")
+        return pull(
+            repo_path=self.config.dest_dir,
+            branch=self._git.branch,
+            ssh_key_path=self.config.ssh_key_path,
+        )
+    
     def _should_skip_rsync(self) -> bool:
         """Check if rsync should be skipped (same source and dest).
         
@@ -148,7 +202,7 @@ class SyncRunner:
             return None
         
         # Check if this is the first sync (no Git history)
-        is_first_sync = not has_commits(self.config.dest_dir)
+        is_first_sync = not self._git.has_commits
         
         if is_first_sync:
             logger.info("🆕 First-time sync detected (no Git history)")
@@ -191,23 +245,39 @@ class SyncRunner:
                 errors=self._errors,
             )
         
-        # Step 3: Git pull (fetch remote updates)
-        logger.info("🔄 Checking remote updates...")
-        pull_result = pull(
-            repo_path=self.config.dest_dir,
-            ssh_key_path=self.config.ssh_key_path,
-        )
+        # Keep one 'git cat-file' process open for revision lookups
+        with GitBatch(self.config.dest_dir):
+            return self._sync_and_push()
+    
+    def _sync_and_push(self) -> SyncResult:
+        """Run the pull, file sync, commit and push steps.
+        
+        Returns:
+            SyncResult with operation status and details.
+        """
+        logger = get_logger()
+        
+        self._git = self._probe_git()
+        
+        # Steps 3 and 4: Git pull (network) and iCloud wait (source polling)
+        # touch different directories, so they run concurrently
+        if self._should_skip_rsync():
+            pull_result = self._pull()
+        else:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pull_future = executor.submit(self._pull)
+                wait_for_icloud_sync(
+                    source_dir=self.config.source_dir,
+                    max_wait_seconds=self.config.icloud_wait_timeout,
+                )
+                pull_result = pull_future.result()
         
         if not pull_result.success:
             # Pull failure is usually network issues; continue with local sync
             self._warnings.append(f"Pull failed (network issue?): {pull_result.error}")
-        
-        # Step 4: Wait for iCloud sync
-        if not self._should_skip_rsync():
-            wait_for_icloud_sync(
-                source_dir=self.config.source_dir,
-                max_wait_seconds=self.config.icloud_wait_timeout,
-            )
+        elif not self._git.has_commits:
+            # A pull into an unborn branch can check out the remote history
+            self._git.has_commits = has_commits(self.config.dest_dir)
         
         # Step 5: Sync files
         rsync_result = self._sync_files()
@@ -228,7 +298,9 @@ class SyncRunner:
         # Step 6: Commit and push
         git_result = commit_and_push(
             repo_path=self.config.dest_dir,
+            branch=self._git.branch,
             ssh_key_path=self.config.ssh_key_path,
+            is_first_push=not self._git.has_commits or self._git.remote_url is None,
         )
         
         if not git_result.success:
@@ -269,13 +341,33 @@ def run_sync(
     return runner.run()
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """Entry point for direct script execution.
     
+    A Click-free equivalent of ``ot sync`` for ``python -m ot.runner``,
+    parsed with argparse so the CLI framework is never imported.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]).
+        
     Returns:
         Exit code (0 for success, 1 for failure).
     """
-    result = run_sync()
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog="python -m ot.runner",
+        description="Run the sync and push operation.",
+    )
+    parser.add_argument(
+        "-c", "--config",
+        type=Path,
+        default=None,
+        help="Path to configuration file.",
+    )
+    args = parser.parse_args(argv)
+    
+    result = run_sync(config_path=args.config)
     
     if not result.success:
         if result.errors:
@@ -283,6 +375,10 @@ def main() -> int:
                 print(f"Error: {error}", file=sys.stderr)
         return 1
     
+    if result.warnings:
+        for warning in result.warnings:
+            print(f"Warning: {warning}", file=sys.stderr)
+    
     return 0
 
 
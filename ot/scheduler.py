@@ -9,9 +9,15 @@ Supports:
 
 from __future__ import annotations
 
+import functools
+import re
+import shlex
+import subprocess
 import sys
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable
 
 from .logger import get_logger
 
@@ -20,15 +26,45 @@ if sys.platform == "darwin":
     from . import launchd_ops
 
 # Common schedule presets
-SCHEDULE_PRESETS = {
+SCHEDULE_PRESETS = MappingProxyType({
     "15min": "*/15 * * * *",
     "30min": "*/30 * * * *",
     "hourly": "0 * * * *",
     "daily": "0 2 * * *",
     "daily_morning": "0 9 * * *",
     "daily_evening": "0 22 * * *",
+})
+
+# Cron line without its comment: five schedule fields, then the command.
+# Each field is \S+ followed by \s+, which cannot overlap, so matching is
+# linear in the line length.
+_CRON_LINE_RE = re.compile(r"^(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S.*)$")
+
+# Whole crontab lines that run a sync: "ot sync" or "ot-sync" in any case,
+# or the "-m ot.runner" / "-m ot.cli.main sync" commands written by
+# _add_cron_schedule now and in earlier versions
+_OT_JOB_LINE_RE = re.compile(
+    r"^.*(?:ot[ -]sync|-m ot\.runner\b|-m ot\.cli\.main sync).*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+_SCHEDULE_DESCRIPTIONS = {
+    "15min": "Every 15 minutes",
+    "30min": "Every 30 minutes",
+    "hourly": "Every hour",
+    "daily": "Daily at 2:00 AM",
+    "daily_morning": "Daily at 9:00 AM",
+    "daily_evening": "Daily at 10:00 PM",
 }
 
+# One alternation over every preset (group "_<preset>", since names such
+# as "15min" are not identifiers) plus the generic "*/N * * * *" form
+# with N >= 1; match.lastgroup says which one matched.
+_SCHED_RE = re.compile("|".join([
+    *(f"(?P<_{name}>{re.escape(expr)})" for name, expr in SCHEDULE_PRESETS.items()),
+    r"(?P<every_n_minutes>\*/(?P<minutes>0*[1-9]\d*) \* \* \* \*)",
+]))
+
 # Launchd preset mappings (Label suffix, Interval/Calendar)
 LAUNCHD_LABEL = "com.user.ot.sync"
 LAUNCHD_PRESETS = {
@@ -83,25 +119,20 @@ def get_current_schedule() -> str | None:
         return None
 
 
+@functools.lru_cache(maxsize=64)
 def describe_schedule(schedule: str) -> str:
     """Describe schedule human-readably."""
     if schedule == "Enabled (macOS Native)":
         return "Active (MacOS Native Scheduler)"
-        
-    # Reuse existing description logic
-    for name, expr in SCHEDULE_PRESETS.items():
-        if schedule == expr:
-            descriptions = {
-                "15min": "Every 15 minutes",
-                "30min": "Every 30 minutes",
-                "hourly": "Every hour",
-                "daily": "Daily at 2:00 AM",
-                "daily_morning": "Daily at 9:00 AM",
-                "daily_evening": "Daily at 10:00 PM",
-            }
-            return descriptions.get(name, name)
-            
-    return schedule
+    
+    match = _SCHED_RE.fullmatch(schedule)
+    if match is None:
+        return schedule
+    if match.lastgroup == "every_n_minutes":
+        minutes = int(match.group("minutes"))
+        return "Every minute" if minutes == 1 else f"Every {minutes} minutes"
+    name = match.lastgroup[1:]
+    return _SCHEDULE_DESCRIPTIONS.get(name, name)
 
 
 # ============================================================================
@@ -124,14 +155,7 @@ def _add_launchd_schedule(schedule: str, config_path: Path | None = None) -> boo
         
     # 2. Build Command
     # Must use absolute path to python/ot
-    ot_cmd_list = _get_ot_command_list()
-    if not ot_cmd_list:
-        logger.error("❌ Could not determine command for LaunchAgent")
-        return False
-        
-    cmd_args = ot_cmd_list + ["sync"]
-    if config_path:
-        cmd_args.extend(["--config", str(config_path)])
+    cmd_args = _get_sync_command_list(config_path)
         
     # 3. Create Plist
     # Clean legacy cron first
@@ -149,11 +173,22 @@ def _add_launchd_schedule(schedule: str, config_path: Path | None = None) -> boo
     return launchd_ops.install_agent(LAUNCHD_LABEL, content)
 
 
-def _get_ot_command_list() -> list[str]:
-    """Get command as list for exec."""
-    # Preferred: direct executable
-    # But for python module, we want [python_exe, "-m", "ot.cli.main"]
-    return [sys.executable, "-m", "ot.cli.main"]
+def _get_sync_command_list(config_path: Path | None = None) -> list[str]:
+    """Get the scheduled sync command as a list for exec.
+    
+    Runs ``python -m ot.runner``, the Click-free equivalent of
+    ``ot sync``, so scheduled runs never import the CLI framework.
+    
+    Args:
+        config_path: Config file to pass with --config, if any.
+        
+    Returns:
+        Command arguments, starting with the absolute Python path.
+    """
+    cmd = [sys.executable, "-m", "ot.runner"]
+    if config_path:
+        cmd.extend(["--config", str(config_path)])
+    return cmd
 
 
 # ============================================================================
@@ -180,18 +215,28 @@ class CronJob:
         comment = None
         if "#" in line:
             line, comment = line.rsplit("#", 1)
-            line = line.strip()
+            line = line.rstrip()
             comment = comment.strip()
-        parts = line.split(None, 5)
-        if len(parts) < 6:
+        match = _CRON_LINE_RE.match(line)
+        if match is None:
             return None
-        return cls(schedule=" ".join(parts[:5]), command=parts[5], comment=comment)
+        *fields, command = match.groups()
+        return cls(schedule=" ".join(fields), command=command, comment=comment)
 
-import subprocess
-
-def _get_current_crontab() -> str:
+def get_current_crontab(runner: Callable[..., Any] | None = None) -> str:
+    """Read the current user's crontab.
+    
+    Args:
+        runner: Function used to run `crontab -l`, with the signature of
+            subprocess.run. Defaults to subprocess.run.
+        
+    Returns:
+        Crontab contents, or "" if there is none or it cannot be read.
+    """
+    if runner is None:
+        runner = subprocess.run
     try:
-        result = subprocess.run(["crontab", "-l"], capture_output=True, text=True, timeout=10)
+        result = runner(["crontab", "-l"], capture_output=True, text=True, timeout=10)
         if result.returncode == 0: return result.stdout
         return ""
     except Exception: return ""
@@ -203,12 +248,10 @@ def _set_crontab(content: str) -> bool:
     except Exception: return False
 
 def find_ot_cron_jobs() -> list[CronJob]:
-    crontab = _get_current_crontab()
     jobs = []
-    for line in crontab.splitlines():
-        if "ot sync" in line.lower() or "ot-sync" in line.lower():
-            job = CronJob.from_cron_line(line)
-            if job: jobs.append(job)
+    for match in _OT_JOB_LINE_RE.finditer(get_current_crontab()):
+        job = CronJob.from_cron_line(match.group())
+        if job: jobs.append(job)
     return jobs
 
 def _add_cron_schedule(schedule: str, config_path: Path | None) -> bool:
@@ -219,20 +262,18 @@ def _add_cron_schedule(schedule: str, config_path: Path | None) -> bool:
     # Simple validation
     if len(cron_schedule.split()) != 5: return False
     
-    ot_cmd = f"{sys.executable} -m ot.cli.main"
-    command = f"{ot_cmd} sync"
-    if config_path: command += f" --config {config_path}"
+    command = shlex.join(_get_sync_command_list(config_path))
     
-    crontab = _get_current_crontab()
-    new_lines = [line for line in crontab.splitlines() 
-                 if "ot sync" not in line.lower() and "ot-sync" not in line.lower()]
+    crontab = get_current_crontab()
+    new_lines = [line for line in crontab.splitlines()
+                 if not _OT_JOB_LINE_RE.match(line)]
     
     job = CronJob(schedule=cron_schedule, command=command, comment="Obsidian Timemachine auto-sync")
     new_lines.append(job.to_cron_line())
     return _set_crontab("\n".join(new_lines) + "\n")
 
 def _remove_cron_schedule() -> bool:
-    crontab = _get_current_crontab()
-    new_lines = [line for line in crontab.splitlines() 
-                 if "ot sync" not in line.lower() and "ot-sync" not in line.lower()]
+    crontab = get_current_crontab()
+    new_lines = [line for line in crontab.splitlines()
+                 if not _OT_JOB_LINE_RE.match(line)]
     return _set_crontab("\n".join(new_lines) + "\n")
@@ -7,10 +7,11 @@ Provides functions for finding, generating, and managing SSH keys.
 from __future__ import annotations
 
 import os
-import shlex
+import re
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable
 
 from .logger import get_logger
 
@@ -18,6 +19,27 @@ from .logger import get_logger
 DEFAULT_SSH_DIR = Path.home() / ".ssh"
 DEFAULT_KEY_NAME = "id_ed25519_obsidian_sync"
 
+# Upper bound for a public key file (a 16384-bit RSA key is under 3 KiB)
+_PUBLIC_KEY_MAX_BYTES = 16384
+
+# Key type named in a key file; "ecdsa" is tried before its substring "dsa"
+_KEY_TYPE_RE = re.compile(r"(ed25519|ecdsa|rsa|dsa)")
+
+# Which type wins when a file name contains several (lowest first)
+_KEY_TYPE_PRIORITY = {"ed25519": 0, "rsa": 1, "ecdsa": 2, "dsa": 3}
+
+
+def public_key_path_for(key_path: Path) -> Path:
+    """Get the public key path that belongs to a private key.
+    
+    Args:
+        key_path: Path to the private key.
+        
+    Returns:
+        The same path with ".pub" appended to the file name.
+    """
+    return key_path.with_name(key_path.name + ".pub")
+
 
 @dataclass
 class SSHKey:
@@ -25,77 +47,139 @@ class SSHKey:
     
     Attributes:
         private_key_path: Path to the private key file.
-        public_key_path: Path to the public key file.
+        public_key_path: Path to the public key file. Derived from the
+            private key path when not given.
         key_type: Type of key (e.g., "ed25519", "rsa").
     """
     private_key_path: Path
-    public_key_path: Path
+    public_key_path: Path | None = None
     key_type: str | None = None
     
+    def __post_init__(self) -> None:
+        """Fill in the conventional public key path if none was given."""
+        if self.public_key_path is None:
+            self.public_key_path = public_key_path_for(self.private_key_path)
+    
     @property
     def exists(self) -> bool:
         """Check if both key files exist."""
         return self.private_key_path.exists() and self.public_key_path.exists()
     
     def get_public_key_content(self) -> str | None:
-        """Read the public key content."""
-        if not self.public_key_path.exists():
+        """Read the public key content.
+        
+        Public keys are a single short line, so the file is read with
+        one unbuffered read rather than through a text-mode file object.
+        """
+        try:
+            fd = os.open(self.public_key_path, os.O_RDONLY | os.O_CLOEXEC)
+        except OSError:
             return None
         try:
-            return self.public_key_path.read_text().strip()
+            data = os.read(fd, _PUBLIC_KEY_MAX_BYTES)
         except OSError:
             return None
+        finally:
+            os.close(fd)
+        return data.decode("utf-8", errors="replace").strip()
 
 
-def find_ssh_keys(ssh_dir: Path | None = None) -> list[SSHKey]:
-    """Find existing SSH private keys.
+def key_type_from_name(name: str) -> str | None:
+    """Guess an SSH key's type from its file name.
+    
+    If the name contains more than one type, the first of ed25519, rsa,
+    ecdsa and dsa is used.
+    
+    Args:
+        name: Key file name (e.g. "id_ed25519").
+        
+    Returns:
+        Key type (e.g. "ed25519", "rsa"), or None if unrecognised.
+    """
+    return min(
+        _KEY_TYPE_RE.findall(name),
+        key=_KEY_TYPE_PRIORITY.__getitem__,
+        default=None,
+    )
+
+
+def list_ssh_key_paths(
+    ssh_dir: Path | None = None,
+    scanner: Callable[[Path], Any] | None = None,
+) -> list[Path]:
+    """List private key files in an SSH directory.
+    
+    Only the directory listing is read; key files are not inspected.
     
     Args:
         ssh_dir: Directory to search. Defaults to ~/.ssh
+        scanner: Function that lists a directory, with the interface of
+            os.scandir (a context manager yielding entries with ``name``
+            and ``is_dir()``). Defaults to os.scandir.
         
     Returns:
-        List of found SSH keys.
+        Paths of the private keys, sorted by name.
     """
     ssh_dir = Path(ssh_dir or DEFAULT_SSH_DIR).expanduser().resolve()
     
-    if not ssh_dir.exists():
+    if scanner is None:
+        scanner = os.scandir
+    
+    try:
+        with scanner(ssh_dir) as entries:
+            names = sorted(
+                entry.name
+                for entry in entries
+                # Common private key pattern; skip public keys and known_hosts
+                if entry.name.startswith("id_")
+                and not entry.name.endswith(".pub")
+                and "known_hosts" not in entry.name
+                and not entry.is_dir()
+            )
+    except OSError:
         return []
     
-    keys: list[SSHKey] = []
+    return [ssh_dir / name for name in names]
+
+
+def describe_ssh_key(key_path: Path) -> SSHKey:
+    """Build an SSHKey for a private key file.
     
-    # Common private key patterns
-    for key_file in ssh_dir.glob("id_*"):
-        # Skip public keys and known_hosts
-        if key_file.suffix == ".pub" or "known_hosts" in key_file.name:
-            continue
-        
-        # Skip if it's a directory
-        if key_file.is_dir():
-            continue
-        
-        # Check for corresponding public key
-        public_key = key_file.with_suffix(key_file.suffix + ".pub")
-        if not public_key.exists():
-            public_key = Path(str(key_file) + ".pub")
-        
-        # Determine key type from filename
-        key_type = None
-        if "ed25519" in key_file.name:
-            key_type = "ed25519"
-        elif "rsa" in key_file.name:
-            key_type = "rsa"
-        elif "ecdsa" in key_file.name:
-            key_type = "ecdsa"
-        elif "dsa" in key_file.name:
-            key_type = "dsa"
+    Touches no files, so listing keys costs a single directory scan.
+    
+    Args:
+        key_path: Path to the private key.
         
-        keys.append(SSHKey(
-            private_key_path=key_file,
-            public_key_path=public_key,
-            key_type=key_type,
-        ))
+    Returns:
+        SSHKey with its public key path and type filled in.
+    """
+    key_path = Path(key_path)
     
-    return keys
+    # The public key is always "<private name>.pub"; whether it exists is
+    # checked by SSHKey.exists when it matters, not while listing
+    return SSHKey(
+        private_key_path=key_path,
+        key_type=key_type_from_name(key_path.name),
+    )
+
+
+def find_ssh_keys(
+    ssh_dir: Path | None = None,
+    scanner: Callable[[Path], Any] | None = None,
+) -> list[SSHKey]:
+    """Find existing SSH private keys.
+    
+    Args:
+        ssh_dir: Directory to search. Defaults to ~/.ssh
+        scanner: Directory lister passed to list_ssh_key_paths.
+        
+    Returns:
+        List of found SSH keys.
+    """
+    return [
+        describe_ssh_key(path)
+        for path in list_ssh_key_paths(ssh_dir, scanner=scanner)
+    ]
 
 
 def check_key_permissions(key_path: Path) -> tuple[bool, str]:
@@ -109,19 +193,16 @@ def check_key_permissions(key_path: Path) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, current_permissions).
     """
-    key_path = Path(key_path).expanduser().resolve()
-    
-    if not key_path.exists():
-        return False, "file not found"
-    
     try:
-        mode = key_path.stat().st_mode & 0o777
-        mode_str = oct(mode)[2:]
-        
-        is_valid = mode in (0o600, 0o400)
-        return is_valid, mode_str
+        mode = os.stat(os.path.expanduser(key_path)).st_mode & 0o777
+    except FileNotFoundError:
+        return False, "file not found"
     except OSError:
         return False, "error"
+    
+    mode_str = oct(mode)[2:]
+    is_valid = mode in (0o600, 0o400)
+    return is_valid, mode_str
 
 
 def fix_key_permissions(key_path: Path) -> bool:
@@ -145,19 +226,141 @@ def fix_key_permissions(key_path: Path) -> bool:
         return False
 
 
+def _crypto_serialization() -> tuple[Any, Any] | None:
+    """Import the optional cryptography primitives for Ed25519 keys.
+    
+    Returns:
+        Tuple of (Ed25519PrivateKey, serialization module), or None if
+        cryptography is not installed.
+    """
+    try:
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+            Ed25519PrivateKey,
+        )
+    except ImportError:
+        return None
+    return Ed25519PrivateKey, serialization
+
+
+def _write_new_file(path: Path, data: bytes, mode: int) -> None:
+    """Create a file with the given mode and contents.
+    
+    The file is created with its final permissions, so a private key is
+    never readable by others even briefly.
+    
+    Args:
+        path: File to create (must not exist).
+        data: Contents to write.
+        mode: Permission bits for the new file.
+        
+    Raises:
+        OSError: If the file exists or cannot be written.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+
+
+def _generate_ed25519_in_process(
+    email: str,
+    key_path: Path,
+    public_key_path: Path,
+) -> bool:
+    """Generate an Ed25519 key pair without running ssh-keygen.
+    
+    Args:
+        email: Email address for the key comment.
+        key_path: Path for the private key.
+        public_key_path: Path for the public key.
+        
+    Returns:
+        True if the key was written, False if cryptography is unavailable.
+        
+    Raises:
+        OSError: If the key files cannot be written.
+    """
+    crypto = _crypto_serialization()
+    if crypto is None:
+        return False
+    Ed25519PrivateKey, serialization = crypto
+    
+    private_key = Ed25519PrivateKey.generate()
+    private_bytes = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.OpenSSH,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    public_bytes = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.OpenSSH,
+        format=serialization.PublicFormat.OpenSSH,
+    )
+    
+    _write_new_file(key_path, private_bytes, 0o600)
+    try:
+        _write_new_file(
+            public_key_path, public_bytes + b" " + email.encode() + b"\n", 0o644
+        )
+    except OSError:
+        _remove_files(key_path)
+        raise
+    return True
+
+
+def _remove_files(*paths: Path) -> None:
+    """Delete files, ignoring ones that are missing or cannot be removed.
+    
+    Args:
+        paths: Files to delete.
+    """
+    for path in paths:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def _install_generated_key(tmp_key_path: Path, key_path: Path) -> None:
+    """Move a freshly generated key pair over its final location.
+    
+    Args:
+        tmp_key_path: Private key written under a temporary name; its
+            public key is next to it with ".pub" appended.
+        key_path: Final path of the private key.
+        
+    Raises:
+        OSError: If a file cannot be moved.
+    """
+    tmp_public_path = public_key_path_for(tmp_key_path)
+    public_key_path = public_key_path_for(key_path)
+    
+    os.replace(tmp_key_path, key_path)
+    if tmp_public_path.exists():
+        os.replace(tmp_public_path, public_key_path)
+    else:
+        # Never leave the old public key next to a new private key
+        _remove_files(public_key_path)
+
+
 def generate_ssh_key(
     email: str,
     key_path: Path | None = None,
     key_type: str = "ed25519",
     overwrite: bool = False,
+    runner: Callable[..., Any] | None = None,
 ) -> SSHKey | None:
     """Generate a new SSH key pair.
     
+    Ed25519 keys are generated in-process when the optional cryptography
+    package is installed; otherwise ssh-keygen is run.
+    
     Args:
         email: Email address for the key comment.
         key_path: Path for the private key. Defaults to ~/.ssh/id_ed25519_obsidian_sync
         key_type: Key type (ed25519 or rsa).
         overwrite: Whether to overwrite existing key.
+        runner: Function used to run ssh-keygen, with the signature of
+            subprocess.run. Defaults to subprocess.run.
         
     Returns:
         SSHKey object if successful, None otherwise.
@@ -168,7 +371,7 @@ def generate_ssh_key(
         key_path = DEFAULT_SSH_DIR / DEFAULT_KEY_NAME
     
     key_path = Path(key_path).expanduser().resolve()
-    public_key_path = Path(str(key_path) + ".pub")
+    public_key_path = public_key_path_for(key_path)
     
     # Check if key exists
     if key_path.exists() and not overwrite:
@@ -184,6 +387,76 @@ def generate_ssh_key(
     
     logger.info(f"⚙️ Generating new {key_type.upper()} SSH key...")
     
+    # Log security warning about passphrase-less key
+    logger.warning(
+        "⚠️ Generating SSH key without passphrase. "
+        "This is required for automated operation but reduces security. "
+        "Keep the private key file secure!"
+    )
+    
+    # Generate under temporary names in the same directory and move the
+    # pair into place only once it exists, so a failed run never loses
+    # the key being replaced
+    tmp_key_path = key_path.with_name(f".{key_path.name}.tmp-{os.getpid()}")
+    tmp_public_path = public_key_path_for(tmp_key_path)
+    _remove_files(tmp_key_path, tmp_public_path)
+    
+    try:
+        generated = _generate_key_files(email, tmp_key_path, key_type, runner)
+        if generated:
+            _install_generated_key(tmp_key_path, key_path)
+    except OSError as e:
+        logger.error(f"❌ Failed to write SSH key: {e}")
+        generated = False
+    finally:
+        _remove_files(tmp_key_path, tmp_public_path)
+    
+    if not generated:
+        return None
+    
+    logger.info(f"✅ SSH key generated: {key_path}")
+    return SSHKey(
+        private_key_path=key_path,
+        public_key_path=public_key_path,
+        key_type=key_type,
+    )
+
+
+def _generate_key_files(
+    email: str,
+    key_path: Path,
+    key_type: str,
+    runner: Callable[..., Any] | None,
+) -> bool:
+    """Write a new key pair to key_path and its ".pub" file.
+    
+    Ed25519 keys are generated in-process when possible; otherwise
+    ssh-keygen is run.
+    
+    Args:
+        email: Email address for the key comment.
+        key_path: Path for the private key (must not exist).
+        key_type: Key type (ed25519 or rsa).
+        runner: Function used to run ssh-keygen, with the signature of
+            subprocess.run. Defaults to subprocess.run.
+        
+    Returns:
+        True if the key was written, False if generation failed.
+        
+    Raises:
+        OSError: If cryptography is used and a key file cannot be written.
+    """
+    logger = get_logger()
+    
+    # Ed25519 keys can be made in-process when cryptography is installed,
+    # which skips starting ssh-keygen
+    if key_type == "ed25519":
+        if _generate_ed25519_in_process(email, key_path, public_key_path_for(key_path)):
+            return True
+    
+    if runner is None:
+        runner = subprocess.run
+    
     # Build ssh-keygen command
     cmd = [
         "ssh-keygen",
@@ -193,38 +466,24 @@ def generate_ssh_key(
         "-N", "",  # No passphrase (security trade-off for automation)
     ]
     
-    # Log security warning about passphrase-less key
-    logger.warning(
-        "⚠️ Generating SSH key without passphrase. "
-        "This is required for automated operation but reduces security. "
-        "Keep the private key file secure!"
-    )
-    
     try:
-        result = subprocess.run(
+        result = runner(
             cmd,
             capture_output=True,
             text=True,
             timeout=30,
         )
-        
-        if result.returncode == 0 and key_path.exists():
-            logger.info(f"✅ SSH key generated: {key_path}")
-            return SSHKey(
-                private_key_path=key_path,
-                public_key_path=public_key_path,
-                key_type=key_type,
-            )
-        else:
-            logger.error(f"❌ ssh-keygen failed: {result.stderr}")
-            return None
-    
     except subprocess.TimeoutExpired:
         logger.error("❌ ssh-keygen timed out")
-        return None
+        return False
     except OSError as e:
         logger.error(f"❌ Failed to run ssh-keygen: {e}")
-        return None
+        return False
+    
+    if result.returncode != 0 or not key_path.exists():
+        logger.error(f"❌ ssh-keygen failed: {result.stderr}")
+        return False
+    return True
 
 
 def test_ssh_connection(
@@ -242,25 +501,21 @@ def test_ssh_connection(
     """
     logger = get_logger()
     
-    cmd = ["ssh", "-T", f"git@{host}"]
-    
-    env = os.environ.copy()
+    # Pass the key as its own argument so paths with spaces need no quoting
+    identity = []
     if ssh_key_path:
         ssh_key_path = Path(ssh_key_path).expanduser().resolve()
-        env["GIT_SSH_COMMAND"] = f"ssh -i {ssh_key_path} -o IdentitiesOnly=yes"
+        identity = ["-i", str(ssh_key_path), "-o", "IdentitiesOnly=yes"]
     
     # Add StrictHostKeyChecking=accept-new to auto-accept new hosts
     cmd = [
         "ssh", "-T",
         "-o", "StrictHostKeyChecking=accept-new",
         "-o", "ConnectTimeout=10",
+        *identity,
+        f"git@{host}",
     ]
     
-    if ssh_key_path:
-        cmd.extend(["-i", str(ssh_key_path), "-o", "IdentitiesOnly=yes"])
-    
-    cmd.append(f"git@{host}")
-    
     try:
         result = subprocess.run(
             cmd,
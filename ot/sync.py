@@ -6,12 +6,22 @@ Provides a robust interface to rsync for mirroring directories.
 
 from __future__ import annotations
 
+import fnmatch
+import functools
+import json
+import os
+import re
 import shutil
 import subprocess
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
 from enum import IntEnum
 from pathlib import Path
+from typing import IO, Callable
 
+from .config import DEFAULT_CACHE_DIR
 from .logger import get_logger
 
 
@@ -30,6 +40,34 @@ class RsyncExitCode(IntEnum):
     CONNECTION_TIMEOUT = 35
 
 
+# Outcome of each exit code that still counts as a usable sync:
+# (success, warning). Partial results are still success since Git keeps
+# the previous state of every file.
+_EXIT_SEMANTICS: dict[int, tuple[bool, str | None]] = {
+    RsyncExitCode.SUCCESS: (True, None),
+    RsyncExitCode.PARTIAL_TRANSFER_ERROR: (
+        True,
+        "rsync reported partial transfer (code 23). "
+        "Some files may have issues.",
+    ),
+    RsyncExitCode.VANISHED_SOURCE_FILES: (
+        True,
+        "rsync reported vanished source files (code 24). "
+        "Some files disappeared during sync (usually harmless).",
+    ),
+}
+
+# Names never synced: the destination's own Git data, Finder and
+# Obsidian trash, and iCloud placeholders for files not yet downloaded
+_DEFAULT_EXCLUDES = (".git", ".DS_Store", ".trash", ".Trash", "*.icloud")
+_DEFAULT_EXCLUDE_ARGS = tuple(
+    arg for pattern in _DEFAULT_EXCLUDES for arg in ("--exclude", pattern)
+)
+
+# Resource deadlock avoided (macOS iCloud); transient, so retried
+_RESOURCE_DEADLOCK_EXIT = 20
+
+
 @dataclass
 class RsyncResult:
     """Result of an rsync operation.
@@ -37,8 +75,8 @@ class RsyncResult:
     Attributes:
         success: Whether the sync completed successfully.
         exit_code: Rsync exit code.
-        stdout: Standard output from rsync.
-        stderr: Standard error from rsync.
+        stdout: Standard output from rsync (last lines only).
+        stderr: Standard error from rsync (last lines only).
         warning: Optional warning message for partial success.
     """
     success: bool
@@ -48,21 +86,89 @@ class RsyncResult:
     warning: str | None = None
 
 
+@functools.lru_cache(maxsize=1)
 def check_rsync_available() -> bool:
     """Check if rsync is available on the system.
     
+    The result is cached for the life of the process.
+    
     Returns:
         True if rsync is found, False otherwise.
     """
     return shutil.which("rsync") is not None
 
 
+# Probed rsync capabilities, kept across runs for the same rsync binary
+_CAPS_CACHE_FILE = DEFAULT_CACHE_DIR / "rsync_caps.json"
+
+
+def _rsync_binary_key() -> str | None:
+    """Identify the installed rsync binary for the capability cache.
+    
+    Returns:
+        "path:mtime_ns:size" of the rsync on PATH, or None if not found.
+    """
+    rsync = shutil.which("rsync")
+    if rsync is None:
+        return None
+    try:
+        st = os.stat(rsync)
+    except OSError:
+        return None
+    return f"{rsync}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _load_cached_caps(key: str) -> dict | None:
+    """Read the capability cache if it was written for this binary.
+    
+    Args:
+        key: Binary key from _rsync_binary_key().
+        
+    Returns:
+        Cached capabilities, or None if missing, stale or unreadable.
+    """
+    try:
+        with open(_CAPS_CACHE_FILE, "rb") as f:
+            caps = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(caps, dict) or caps.get("key") != key:
+        return None
+    return caps
+
+
+def _save_cached_caps(caps: dict) -> None:
+    """Write the capability cache, ignoring failures.
+    
+    Args:
+        caps: Capabilities including the binary key.
+    """
+    tmp_path = _CAPS_CACHE_FILE.with_name(_CAPS_CACHE_FILE.name + ".tmp")
+    try:
+        _CAPS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(caps), encoding="utf-8")
+        os.replace(tmp_path, _CAPS_CACHE_FILE)
+    except OSError:
+        pass  # The cache is an optimization only
+
+
+@functools.lru_cache(maxsize=1)
 def check_rsync_iconv_support() -> bool:
     """Check if rsync supports iconv for filename encoding.
     
+    The answer is cached for the life of the process and on disk for as
+    long as the rsync binary on PATH is unchanged, so `rsync --version`
+    runs once per rsync install rather than once per sync.
+    
     Returns:
         True if rsync has iconv support, False otherwise.
     """
+    key = _rsync_binary_key()
+    if key is not None:
+        caps = _load_cached_caps(key)
+        if caps is not None:
+            return bool(caps.get("iconv"))
+    
     try:
         result = subprocess.run(
             ["rsync", "--version"],
@@ -70,9 +176,19 @@ def check_rsync_iconv_support() -> bool:
             text=True,
             timeout=10,
         )
-        return "iconv" in result.stdout.lower()
     except (subprocess.SubprocessError, OSError):
         return False
+    
+    iconv = "iconv" in result.stdout.lower()
+    if key is not None and result.returncode == 0:
+        _save_cached_caps({"key": key, "iconv": iconv})
+    return iconv
+
+
+def _reset_caches() -> None:
+    """Forget the cached rsync capability checks (for tests)."""
+    check_rsync_available.cache_clear()
+    check_rsync_iconv_support.cache_clear()
 
 
 def build_rsync_command(
@@ -96,7 +212,10 @@ def build_rsync_command(
     Returns:
         List of command arguments.
     """
-    cmd = ["rsync", "-av", "--progress"]
+    # Both ends are local paths, so skip the delta algorithm. Files are
+    # still written via a temp file and rename: a partial run (codes 23
+    # and 24) is committed, and must not leave truncated files behind.
+    cmd = ["rsync", "-av", "--progress", "--whole-file"]
     
     if dry_run:
         cmd.append("--dry-run")
@@ -104,13 +223,9 @@ def build_rsync_command(
     if delete:
         cmd.append("--delete")
     
-    # Default exclusions
-    default_excludes = [".git", ".DS_Store", ".trash", ".Trash", "*.icloud"]
-    exclude_patterns = exclude_patterns or []
-    all_excludes = default_excludes + exclude_patterns
-    
-    for pattern in all_excludes:
-        cmd.extend(["--exclude", pattern])
+    cmd.extend(_DEFAULT_EXCLUDE_ARGS)
+    for pattern in exclude_patterns or ():
+        cmd += ("--exclude", pattern)
     
     # Add iconv for macOS Unicode normalization if supported
     if use_iconv:
@@ -123,6 +238,83 @@ def build_rsync_command(
     return cmd
 
 
+# Lines of rsync output kept in RsyncResult; earlier lines are discarded
+_OUTPUT_TAIL_LINES = 200
+
+# Seconds to wait for the output readers once the process has exited
+_READER_JOIN_TIMEOUT = 5
+
+
+def _drain(stream: IO[bytes], tail: deque[bytes]) -> None:
+    """Read a pipe to EOF, keeping only its last lines, then close it.
+    
+    Args:
+        stream: Binary pipe to read.
+        tail: Bounded deque that receives the raw lines.
+    """
+    with stream:
+        tail.extend(stream)
+
+
+def _decode_tail(tail: deque[bytes]) -> str:
+    """Join and decode the lines kept by _drain."""
+    # list() copies the deque in one step, even if its reader still runs
+    return "\n".join(
+        raw.decode("utf-8", errors="replace").rstrip() for raw in list(tail)
+    )
+
+
+def _run_streaming(cmd: list[str], timeout: int | None) -> tuple[int, str, str]:
+    """Run a command, streaming its output instead of buffering it.
+    
+    Both pipes are drained on background threads so neither can fill up
+    and stall the process. Only the last _OUTPUT_TAIL_LINES of each
+    stream are kept, keeping memory flat however many files rsync lists.
+    
+    The readers own their pipes. Once the process has exited they get
+    _READER_JOIN_TIMEOUT seconds to finish, so a child that inherited
+    the pipes and keeps them open cannot hang the sync.
+    
+    Args:
+        cmd: Command and arguments.
+        timeout: Seconds to wait for the process (None for no limit).
+        
+    Returns:
+        Tuple of (exit code, stdout tail, stderr tail).
+        
+    Raises:
+        subprocess.TimeoutExpired: If the process was killed for running
+            past the timeout.
+        OSError: If the command could not be started.
+    """
+    stdout_tail: deque[bytes] = deque(maxlen=_OUTPUT_TAIL_LINES)
+    stderr_tail: deque[bytes] = deque(maxlen=_OUTPUT_TAIL_LINES)
+    
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    readers = [
+        threading.Thread(target=_drain, args=(proc.stdout, stdout_tail), daemon=True),
+        threading.Thread(target=_drain, args=(proc.stderr, stderr_tail), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    
+    try:
+        exit_code = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        for reader in readers:
+            reader.join(_READER_JOIN_TIMEOUT)
+    
+    return exit_code, _decode_tail(stdout_tail), _decode_tail(stderr_tail)
+
+
 def run_rsync(
     source: Path,
     dest: Path,
@@ -189,86 +381,36 @@ def run_rsync(
     for attempt in range(1, MAX_RETRIES + 1):
         if attempt > 1:
             logger.info(f"🔄 Retry attempt {attempt}/{MAX_RETRIES} in {RETRY_DELAY}s...")
-            import time
             time.sleep(RETRY_DELAY)
             
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=timeout,
-            )
+            exit_code, stdout, stderr = _run_streaming(cmd, timeout)
             
-            exit_code = result.returncode
-            # Decode with error handling for non-UTF-8 bytes
-            stdout = result.stdout.decode("utf-8", errors="replace")
-            stderr = result.stderr.decode("utf-8", errors="replace")
-            
-            # Interpret exit code
-            if exit_code == RsyncExitCode.SUCCESS:
-                if attempt > 1:
-                    logger.info("✅ Rsync succeeded after retry.")
-                else:
-                    logger.info("✅ Rsync completed successfully.")
-                    
-                return RsyncResult(
-                    success=True,
-                    exit_code=exit_code,
-                    stdout=stdout,
-                    stderr=stderr,
-                )
+            success, warning = _EXIT_SEMANTICS.get(exit_code, (False, None))
             
-            elif exit_code == 20: # Resource deadlock avoided (macOS iCloud)
+            if exit_code == _RESOURCE_DEADLOCK_EXIT:
                 logger.error(f"❌ rsync failed with exit code {exit_code} (Resource deadlock)")
                 if attempt < MAX_RETRIES:
                     continue # Retry
-                
-                return RsyncResult(
-                    success=False,
-                    exit_code=exit_code,
-                    stdout=stdout,
-                    stderr=stderr,
-                )
-            
-            elif exit_code == RsyncExitCode.PARTIAL_TRANSFER_ERROR:
-                warning = (
-                    "rsync reported partial transfer (code 23). "
-                    "Some files may have issues."
-                )
-                logger.warning(f"⚠️ {warning}")
-                return RsyncResult(
-                    success=True,  # Partial success is still success
-                    exit_code=exit_code,
-                    stdout=stdout,
-                    stderr=stderr,
-                    warning=warning,
-                )
-            
-            elif exit_code == RsyncExitCode.VANISHED_SOURCE_FILES:
-                warning = (
-                    "rsync reported vanished source files (code 24). "
-                    "Some files disappeared during sync (usually harmless)."
-                )
-                logger.warning(f"⚠️ {warning}")
-                return RsyncResult(
-                    success=True,
-                    exit_code=exit_code,
-                    stdout=stdout,
-                    stderr=stderr,
-                    warning=warning,
-                )
-            
-            else:
+            elif not success:
                 logger.error(f"❌ rsync failed with exit code {exit_code}")
                 # Don't log full stderr here if we are returning it, caller might log it
                 # But we do log it for debug visibility
                 logger.debug(f"stderr: {stderr}")
-                return RsyncResult(
-                    success=False,
-                    exit_code=exit_code,
-                    stdout=stdout,
-                    stderr=stderr,
-                )
+            elif warning:
+                logger.warning(f"⚠️ {warning}")
+            elif attempt > 1:
+                logger.info("✅ Rsync succeeded after retry.")
+            else:
+                logger.info("✅ Rsync completed successfully.")
+            
+            return RsyncResult(
+                success=success,
+                exit_code=exit_code,
+                stdout=stdout,
+                stderr=stderr,
+                warning=warning,
+            )
         
         except subprocess.TimeoutExpired:
             logger.error(f"❌ rsync timed out after {timeout}s")
@@ -291,20 +433,138 @@ def run_rsync(
             )
 
 
+# Characters that make an exclude pattern a wildcard rather than a name
+_WILDCARD_RE = re.compile(r"[*?\[]")
+
+
+def _exclude_matcher(patterns: tuple[str, ...]) -> Callable[[str, str], bool]:
+    """Build a predicate that checks entries against exclude patterns.
+    
+    Patterns follow rsync: one without a "/" matches the entry's name at
+    any depth, one with a "/" matches the end of its path relative to the
+    source, or the whole path if it starts with "/". Plain names are
+    checked with one set lookup; only patterns that contain wildcards or
+    slashes go through fnmatch.
+    
+    Args:
+        patterns: Exact names, paths or shell-style wildcard patterns.
+        
+    Returns:
+        Function of (name, path relative to the source, "/"-separated)
+        returning True for an entry that matches any pattern.
+    """
+    names = [p.rstrip("/") for p in patterns if "/" not in p.rstrip("/")]
+    exact = frozenset(p for p in names if not _WILDCARD_RE.search(p))
+    globs = tuple(p for p in names if _WILDCARD_RE.search(p))
+    
+    path_globs: list[str] = []
+    for pattern in patterns:
+        pattern = pattern.rstrip("/")
+        if "/" not in pattern:
+            continue
+        if pattern.startswith("/"):
+            path_globs.append(pattern.lstrip("/"))
+        else:
+            path_globs.extend((pattern, f"*/{pattern}"))
+    
+    def is_excluded(name: str, rel_path: str) -> bool:
+        return (
+            name in exact
+            or any(fnmatch.fnmatchcase(name, pattern) for pattern in globs)
+            or any(fnmatch.fnmatchcase(rel_path, pattern) for pattern in path_globs)
+        )
+    
+    return is_excluded
+
+
+def _copy_tree(
+    source: str,
+    dest: str,
+    is_excluded: Callable[[str, str], bool],
+) -> tuple[int, list[str]]:
+    """Copy a directory tree in one walk, skipping excluded names.
+    
+    Excluded directories are pruned before descent so their contents are
+    never read. Files are copied with shutil.copy2, which uses the
+    kernel's in-place copy where available and preserves metadata;
+    symlinks are recreated rather than followed, as with ``cp -Rp``.
+    
+    Args:
+        source: Source directory path.
+        dest: Destination directory path (must exist).
+        is_excluded: Predicate of (name, relative path) for entries to skip.
+        
+    Returns:
+        Tuple of (number of files copied, list of error messages).
+    """
+    copied = 0
+    errors: list[str] = []
+    created_dirs: list[tuple[str, str]] = []
+    
+    for root, dirnames, filenames in os.walk(
+        source, onerror=lambda e: errors.append(str(e))
+    ):
+        rel_root = os.path.relpath(root, source)
+        target_root = os.path.join(dest, rel_root)
+        prefix = "" if rel_root == os.curdir else rel_root.replace(os.sep, "/") + "/"
+        
+        kept = []
+        for name in dirnames:
+            if is_excluded(name, prefix + name):
+                continue
+            src = os.path.join(root, name)
+            if os.path.islink(src):
+                # Not descended into by os.walk; copy the link itself
+                filenames.append(name)
+                continue
+            dst = os.path.join(target_root, name)
+            try:
+                os.makedirs(dst, exist_ok=True)
+            except OSError as e:
+                errors.append(str(e))
+                continue
+            created_dirs.append((src, dst))
+            kept.append(name)
+        dirnames[:] = kept
+        
+        for name in filenames:
+            if is_excluded(name, prefix + name):
+                continue
+            try:
+                shutil.copy2(
+                    os.path.join(root, name),
+                    os.path.join(target_root, name),
+                    follow_symlinks=False,
+                )
+                copied += 1
+            except OSError as e:
+                errors.append(str(e))
+    
+    # Directory times change as files are added, so set them last
+    for src, dst in reversed(created_dirs):
+        try:
+            shutil.copystat(src, dst)
+        except OSError:
+            pass
+    
+    return copied, errors
+
+
 def copy_directory_initial(
     source: Path,
     dest: Path,
     exclude_patterns: list[str] | None = None,
 ) -> RsyncResult:
-    """Perform initial copy using cp for reliability.
+    """Perform the initial copy of the vault into the destination.
     
-    For the first sync, using cp is more reliable than rsync,
-    especially with iCloud directories.
+    For the first sync, a plain copy is more reliable than rsync,
+    especially with iCloud directories. The source is walked once and
+    excluded entries (including .icloud placeholders) are never copied.
     
     Args:
         source: Source directory path.
         dest: Destination directory path.
-        exclude_patterns: Patterns to exclude (cleaned up after copy).
+        exclude_patterns: Additional names or patterns to exclude.
         
     Returns:
         RsyncResult with operation status.
@@ -314,76 +574,35 @@ def copy_directory_initial(
     source = Path(source).expanduser().resolve()
     dest = Path(dest).expanduser().resolve()
     
-    logger.info("📦 First sync: using cp for reliability...")
+    logger.info("📦 First sync: copying vault...")
     
-    # Count files for progress indication
-    try:
-        file_count = sum(1 for _ in source.rglob("*") if _.is_file())
-        logger.info(f"📊 Found {file_count} files to copy")
-    except OSError:
-        file_count = 0
+    excludes = _DEFAULT_EXCLUDES + tuple(exclude_patterns or ())
     
     try:
-        # Use cp -Rp for recursive copy preserving attributes
-        cmd = ["cp", "-Rp", f"{source}/.", str(dest)]
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600,  # 10 minutes for large vaults
-        )
-        
-        if result.returncode != 0:
-            return RsyncResult(
-                success=False,
-                exit_code=result.returncode,
-                stdout=result.stdout,
-                stderr=result.stderr,
-            )
-        
-        # Clean up excluded patterns after copy
-        default_excludes = [".DS_Store", ".trash", ".Trash"]
-        exclude_patterns = exclude_patterns or []
-        all_excludes = default_excludes + exclude_patterns
-        
-        for pattern in all_excludes:
-            for match in dest.rglob(pattern):
-                try:
-                    if match.is_dir():
-                        shutil.rmtree(match)
-                    else:
-                        match.unlink()
-                except OSError:
-                    pass
-        
-        # Remove .icloud placeholder files
-        for icloud_file in dest.rglob("*.icloud"):
-            try:
-                icloud_file.unlink()
-            except OSError:
-                pass
-        
-        logger.info("✅ Initial copy completed successfully.")
-        return RsyncResult(
-            success=True,
-            exit_code=0,
-            stdout="Initial copy completed",
-            stderr="",
-        )
-    
-    except subprocess.TimeoutExpired:
+        dest.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
         return RsyncResult(
             success=False,
             exit_code=-1,
             stdout="",
-            stderr="Copy operation timed out",
+            stderr=str(e),
         )
     
-    except OSError as e:
+    copied, errors = _copy_tree(str(source), str(dest), _exclude_matcher(excludes))
+    logger.info(f"📊 Copied {copied} files")
+    
+    if errors:
         return RsyncResult(
             success=False,
-            exit_code=-1,
-            stdout="",
-            stderr=str(e),
+            exit_code=1,
+            stdout=f"Copied {copied} files",
+            stderr="\n".join(errors),
         )
+    
+    logger.info("✅ Initial copy completed successfully.")
+    return RsyncResult(
+        success=True,
+        exit_code=0,
+        stdout="Initial copy completed",
+        stderr="",
+    )
@@ -6,32 +6,50 @@ Provides functionality to check for updates and upgrade to the latest version.
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import re
 import subprocess
 import sys
+import time
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Any
+from itertools import zip_longest
+from typing import Any, Callable
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
+from .config import DEFAULT_CACHE_DIR
 from .logger import get_logger
+from .version import (
+    GITHUB_OWNER,
+    GITHUB_REPO,
+    GITHUB_REPO_URL,
+    UpdateError,
+    get_current_version,
+)
 
 
-# GitHub repository information
-GITHUB_OWNER = "StrongTechProject"
-GITHUB_REPO = "Obsidian-TimeMachine"
+# GitHub API endpoint
 GITHUB_API_BASE = "https://api.github.com"
-GITHUB_REPO_URL = f"https://github.com/{GITHUB_OWNER}/{GITHUB_REPO}"
 
 # Request timeout in seconds
 REQUEST_TIMEOUT = 15
 
+# Seconds a check_for_updates() result is reused
+CHECK_CACHE_TTL = 300
 
-class UpdateError(Exception):
-    """Raised when update operations fail."""
-    pass
+# (time.monotonic() of the check, result) of the last update check
+_check_cache: tuple[float, UpdateInfo] | None = None
+
+# Last response per API URL with its ETag, plus any rate-limit reset time
+_API_CACHE_FILE = DEFAULT_CACHE_DIR / "github_api.json"
+
+# Start of a pre-release or build suffix, e.g. "-beta" or "+build.1"
+_VERSION_SUFFIX_RE = re.compile(r"[-+]")
+
+# Leading digits of a version component such as "2rc1"
+_LEADING_DIGITS_RE = re.compile(r"\d+")
 
 
 @dataclass
@@ -54,37 +72,12 @@ class UpdateInfo:
     published_at: str | None = None
 
 
-def get_current_version() -> str:
-    """Get the currently installed version of obsidian-timemachine.
-    
-    Returns:
-        Version string (e.g., "0.1.0").
-        
-    Raises:
-        UpdateError: If version cannot be determined.
-    """
-    try:
-        from importlib.metadata import version
-        return version("obsidian-timemachine")
-    except Exception:
-        # Fallback: try to read from pyproject.toml
-        try:
-            pyproject = Path(__file__).parent.parent / "pyproject.toml"
-            if pyproject.exists():
-                content = pyproject.read_text()
-                match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-                if match:
-                    return match.group(1)
-        except Exception:
-            pass
-        
-        raise UpdateError("Cannot determine current version")
-
-
+@functools.lru_cache(maxsize=128)
 def parse_version(version_str: str) -> tuple[int, ...]:
     """Parse a semantic version string into a tuple of integers.
     
-    Handles versions like "0.1.0", "v0.1.0", "0.1.0-beta".
+    Handles versions like "0.1.0", "v0.1.0", "0.1.0-beta". Results are
+    cached, since the same few tags are compared repeatedly.
     
     Args:
         version_str: Version string to parse.
@@ -92,11 +85,8 @@ def parse_version(version_str: str) -> tuple[int, ...]:
     Returns:
         Tuple of version components (major, minor, patch, ...).
     """
-    # Remove 'v' prefix if present
-    version_str = version_str.lstrip("v")
-    
-    # Remove pre-release suffix (e.g., "-beta", "-rc1")
-    version_str = re.split(r"[-+]", version_str)[0]
+    # Remove 'v' prefix and pre-release suffix (e.g., "-beta", "-rc1")
+    version_str = _VERSION_SUFFIX_RE.split(version_str.lstrip("v"), maxsplit=1)[0]
     
     # Split and convert to integers
     parts = []
@@ -105,9 +95,9 @@ def parse_version(version_str: str) -> tuple[int, ...]:
             parts.append(int(part))
         except ValueError:
             # Extract leading digits
-            match = re.match(r"(\d+)", part)
+            match = _LEADING_DIGITS_RE.match(part)
             if match:
-                parts.append(int(match.group(1)))
+                parts.append(int(match.group()))
     
     return tuple(parts) if parts else (0,)
 
@@ -125,22 +115,188 @@ def compare_versions(v1: str, v2: str) -> int:
     parsed_v1 = parse_version(v1)
     parsed_v2 = parse_version(v2)
     
-    # Pad shorter tuple with zeros
-    max_len = max(len(parsed_v1), len(parsed_v2))
-    padded_v1 = parsed_v1 + (0,) * (max_len - len(parsed_v1))
-    padded_v2 = parsed_v2 + (0,) * (max_len - len(parsed_v2))
+    # Missing components count as zero; stop at the first difference
+    for a, b in zip_longest(parsed_v1, parsed_v2, fillvalue=0):
+        if a != b:
+            return (a > b) - (a < b)
+    return 0
+
+
+def _load_api_cache() -> dict[str, Any]:
+    """Read the GitHub API response cache.
     
-    if padded_v1 < padded_v2:
-        return -1
-    elif padded_v1 > padded_v2:
-        return 1
-    else:
-        return 0
+    Malformed entries are dropped, so a truncated or hand-edited file
+    only costs a normal request.
+    
+    Returns:
+        Cache contents, or an empty cache if missing or unreadable.
+    """
+    try:
+        with open(_API_CACHE_FILE, "rb") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {"responses": {}}
+    if not isinstance(cache, dict) or not isinstance(cache.get("responses"), dict):
+        return {"responses": {}}
+    
+    # Each response must be an {"etag": str, "body": ...} entry
+    valid: dict[str, Any] = {"responses": {
+        url: entry
+        for url, entry in cache["responses"].items()
+        if isinstance(entry, dict) and isinstance(entry.get("etag"), str) and "body" in entry
+    }}
+    reset = cache.get("rate_limit_reset")
+    if isinstance(reset, (int, float)) and not isinstance(reset, bool):
+        valid["rate_limit_reset"] = reset
+    return valid
+
+
+def _save_api_cache(cache: dict[str, Any]) -> None:
+    """Write the GitHub API response cache, ignoring failures.
+    
+    Args:
+        cache: Cache contents to write.
+    """
+    tmp_path = _API_CACHE_FILE.with_name(_API_CACHE_FILE.name + ".tmp")
+    try:
+        _API_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp_path, _API_CACHE_FILE)
+    except OSError:
+        pass  # The cache is an optimization only
+
+
+def _note_rate_limit(cache: dict[str, Any], headers: Any) -> None:
+    """Record when the rate limit resets if the quota is used up.
+    
+    Args:
+        cache: API cache to update.
+        headers: Response headers (may be None).
+    """
+    if headers is None or headers.get("X-RateLimit-Remaining") != "0":
+        cache.pop("rate_limit_reset", None)
+        return
+    try:
+        cache["rate_limit_reset"] = int(headers.get("X-RateLimit-Reset"))
+    except (TypeError, ValueError):
+        cache.pop("rate_limit_reset", None)
+
+
+@functools.cache
+def _json_loads() -> Callable[[bytes], Any]:
+    """Pick the JSON decoder for API responses.
+    
+    orjson is used when installed; its JSONDecodeError subclasses the
+    standard library's, so callers catch json.JSONDecodeError either way.
+    
+    Returns:
+        orjson.loads if available, otherwise json.loads.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+@dataclass
+class _HTTPResponse:
+    """Status, headers and body of a GitHub API response."""
+    status: int
+    reason: str
+    headers: Any
+    body: bytes
+
+
+@functools.cache
+def _urllib3_pool() -> tuple[Any, Any] | None:
+    """Create the shared connection pool if urllib3 is installed.
+    
+    The pool keeps the TLS connection to the API open, so later
+    requests in the same process skip the handshake.
+    
+    Returns:
+        Tuple of (PoolManager, urllib3.exceptions module), or None if
+        urllib3 is not installed.
+    """
+    try:
+        import urllib3
+    except ImportError:
+        return None
+    pool = urllib3.PoolManager(
+        maxsize=4,
+        retries=urllib3.Retry(total=2, backoff_factor=0.2),
+    )
+    return pool, urllib3.exceptions
+
+
+def _get_with_pool(
+    pooled: tuple[Any, Any], url: str, headers: dict[str, str]
+) -> _HTTPResponse:
+    """GET a URL through the urllib3 connection pool.
+    
+    Args:
+        pooled: Result of _urllib3_pool().
+        url: URL to fetch.
+        headers: Request headers.
+        
+    Returns:
+        The response, whatever its status.
+        
+    Raises:
+        UpdateError: If no response was received.
+    """
+    pool, exceptions = pooled
+    try:
+        response = pool.request(
+            "GET", url, headers=headers, timeout=REQUEST_TIMEOUT
+        )
+    except exceptions.TimeoutError:
+        raise UpdateError("Request timed out")
+    except exceptions.MaxRetryError as e:
+        # Once the retries are used up, the last failure is the reason
+        if isinstance(e.reason, exceptions.TimeoutError):
+            raise UpdateError("Request timed out")
+        raise UpdateError(f"Network error: {e.reason}")
+    except exceptions.HTTPError as e:
+        raise UpdateError(f"Network error: {e}")
+    return _HTTPResponse(response.status, response.reason, response.headers, response.data)
+
+
+def _get_with_urlopen(url: str, headers: dict[str, str]) -> _HTTPResponse:
+    """GET a URL with urllib, on a new connection.
+    
+    Args:
+        url: URL to fetch.
+        headers: Request headers.
+        
+    Returns:
+        The response, whatever its status.
+        
+    Raises:
+        UpdateError: If no response was received.
+    """
+    try:
+        with urlopen(Request(url, headers=headers), timeout=REQUEST_TIMEOUT) as response:
+            # urlopen raises HTTPError for everything but a success
+            return _HTTPResponse(200, "OK", response.headers, response.read())
+    except HTTPError as e:
+        return _HTTPResponse(e.code, e.reason, e.headers, b"")
+    except URLError as e:
+        raise UpdateError(f"Network error: {e.reason}")
+    except TimeoutError:
+        raise UpdateError("Request timed out")
 
 
 def _fetch_github_api(endpoint: str) -> dict[str, Any]:
     """Fetch data from GitHub API.
     
+    Responses are cached on disk with their ETag and revalidated with
+    If-None-Match; GitHub answers an unchanged resource with a bodyless
+    304 that does not count against the rate limit. While the rate
+    limit is exhausted no request is made and the cached response, if
+    any, is returned.
+    
     Args:
         endpoint: API endpoint (e.g., "/repos/owner/repo/releases/latest").
         
@@ -152,30 +308,50 @@ def _fetch_github_api(endpoint: str) -> dict[str, Any]:
     """
     url = f"{GITHUB_API_BASE}{endpoint}"
     
-    request = Request(
-        url,
-        headers={
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": f"obsidian-timemachine/{get_current_version()}",
-        },
-    )
+    cache = _load_api_cache()
+    cached = cache["responses"].get(url)
+    
+    if cache.get("rate_limit_reset", 0) > time.time():
+        if cached is not None:
+            return cached["body"]
+        raise UpdateError("GitHub API rate limit exceeded. Try again later.")
+    
+    headers = {
+        "Accept": "application/vnd.github.v3+json",
+        "User-Agent": f"obsidian-timemachine/{get_current_version()}",
+    }
+    if cached is not None and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    
+    pooled = _urllib3_pool()
+    if pooled is not None:
+        response = _get_with_pool(pooled, url, headers)
+    else:
+        response = _get_with_urlopen(url, headers)
+    
+    if response.status == 304 and cached is not None:
+        return cached["body"]
+    if response.status == 404:
+        raise UpdateError("Repository or release not found")
+    elif response.status == 403:
+        _note_rate_limit(cache, response.headers)
+        _save_api_cache(cache)
+        raise UpdateError("GitHub API rate limit exceeded. Try again later.")
+    elif response.status != 200:
+        raise UpdateError(f"GitHub API error: {response.status} {response.reason}")
     
     try:
-        with urlopen(request, timeout=REQUEST_TIMEOUT) as response:
-            return json.loads(response.read().decode("utf-8"))
-    except HTTPError as e:
-        if e.code == 404:
-            raise UpdateError("Repository or release not found")
-        elif e.code == 403:
-            raise UpdateError("GitHub API rate limit exceeded. Try again later.")
-        else:
-            raise UpdateError(f"GitHub API error: {e.code} {e.reason}")
-    except URLError as e:
-        raise UpdateError(f"Network error: {e.reason}")
+        body = _json_loads()(response.body)
     except json.JSONDecodeError as e:
         raise UpdateError(f"Invalid API response: {e}")
-    except TimeoutError:
-        raise UpdateError("Request timed out")
+    
+    etag = response.headers.get("ETag") if response.headers is not None else None
+    if etag:
+        cache["responses"][url] = {"etag": etag, "body": body}
+    _note_rate_limit(cache, response.headers)
+    _save_api_cache(cache)
+    
+    return body
 
 
 def get_latest_release() -> dict[str, Any]:
@@ -219,15 +395,31 @@ def _get_latest_tag() -> dict[str, Any]:
     }
 
 
+def _clear_check_cache() -> None:
+    """Forget the last update check result."""
+    global _check_cache
+    _check_cache = None
+
+
 def check_for_updates() -> UpdateInfo:
     """Check if a new version is available.
     
+    A result is reused for CHECK_CACHE_TTL seconds, so a prompt followed
+    by an update does not ask GitHub twice.
+    
     Returns:
         UpdateInfo with current and latest version details.
         
     Raises:
         UpdateError: If version check fails.
     """
+    global _check_cache
+    
+    if _check_cache is not None:
+        checked_at, info = _check_cache
+        if time.monotonic() - checked_at < CHECK_CACHE_TTL:
+            return info
+    
     current = get_current_version()
     release = get_latest_release()
     
@@ -237,7 +429,7 @@ def check_for_updates() -> UpdateInfo:
     
     is_latest = compare_versions(current, latest) >= 0
     
-    return UpdateInfo(
+    info = UpdateInfo(
         current_version=current,
         latest_version=latest,
         is_latest=is_latest,
@@ -245,15 +437,47 @@ def check_for_updates() -> UpdateInfo:
         release_notes=release.get("body"),
         published_at=release.get("published_at"),
     )
+    _check_cache = (time.monotonic(), info)
+    return info
+
+
+def _pip_install_args() -> list[str]:
+    """Build the pip arguments that upgrade from the GitHub repository.
+    
+    Returns:
+        Arguments following "pip", e.g. ["install", "--upgrade", url].
+    """
+    pip_url = f"git+https://github.com/{GITHUB_OWNER}/{GITHUB_REPO}.git"
+    
+    # Check if we're in a virtual environment
+    in_venv = hasattr(sys, "real_prefix") or (
+        hasattr(sys, "base_prefix") and sys.base_prefix != sys.prefix
+    )
+    
+    install_args = ["install", "--upgrade", pip_url]
+    
+    # Use --user if not in a virtual environment
+    if not in_venv:
+        install_args.insert(1, "--user")
+    
+    return install_args
 
 
-def perform_update(force: bool = False) -> bool:
+def perform_update(
+    force: bool = False,
+    info: UpdateInfo | None = None,
+    runner: Callable[..., Any] | None = None,
+) -> bool:
     """Perform the update to the latest version.
     
     This uses pip to upgrade the package from the GitHub repository.
     
     Args:
         force: If True, reinstall even if already at latest version.
+        info: Result of an earlier check_for_updates() call, reused
+            instead of checking again.
+        runner: Function used to run pip, with the signature of
+            subprocess.run. Defaults to subprocess.run.
         
     Returns:
         True if update was successful.
@@ -266,7 +490,8 @@ def perform_update(force: bool = False) -> bool:
     # Check if update is needed
     if not force:
         try:
-            info = check_for_updates()
+            if info is None:
+                info = check_for_updates()
             if info.is_latest:
                 logger.info(f"✅ Already at the latest version ({info.current_version})")
                 return True
@@ -274,29 +499,15 @@ def perform_update(force: bool = False) -> bool:
             # Continue with update if check fails
             pass
     
-    # Build pip command
-    pip_url = f"git+https://github.com/{GITHUB_OWNER}/{GITHUB_REPO}.git"
-    
-    # Determine pip command
-    pip_cmd = [sys.executable, "-m", "pip"]
-    
-    # Check if we're in a virtual environment
-    in_venv = hasattr(sys, "real_prefix") or (
-        hasattr(sys, "base_prefix") and sys.base_prefix != sys.prefix
-    )
-    
-    install_args = ["install", "--upgrade", pip_url]
-    
-    # Use --user if not in a virtual environment
-    if not in_venv:
-        install_args.insert(1, "--user")
+    if runner is None:
+        runner = subprocess.run
     
-    full_cmd = pip_cmd + install_args
+    full_cmd = [sys.executable, "-m", "pip", *_pip_install_args()]
     
     logger.info(f"📦 Running: {' '.join(full_cmd)}")
     
     try:
-        result = subprocess.run(
+        result = runner(
             full_cmd,
             capture_output=True,
             text=True,
@@ -304,6 +515,7 @@ def perform_update(force: bool = False) -> bool:
         )
         
         if result.returncode == 0:
+            _clear_check_cache()
             logger.info("✅ Update completed successfully!")
             logger.info("   Please restart the application to use the new version.")
             return True
@@ -317,11 +529,11 @@ def perform_update(force: bool = False) -> bool:
         raise UpdateError(f"Failed to run pip: {e}")
 
 
-def get_update_command() -> str:
+def get_update_command() -> list[str]:
     """Get the command that users can run to update manually.
     
     Returns:
-        Command string for manual update.
+        Command arguments for manual update; shlex.join() them for display.
     """
     pip_url = f"git+https://github.com/{GITHUB_OWNER}/{GITHUB_REPO}.git"
-    return f"pip install --upgrade {pip_url}"
+    return ["pip", "install", "--upgrade", pip_url]
@@ -0,0 +1,57 @@
+"""
+Version information for Obsidian Timemachine.
+
+Kept separate from the updater so that reading the installed version
+does not import the HTTP/JSON stack used for update checks.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from pathlib import Path
+
+
+# GitHub repository information
+GITHUB_OWNER = "StrongTechProject"
+GITHUB_REPO = "Obsidian-TimeMachine"
+GITHUB_REPO_URL = f"https://github.com/{GITHUB_OWNER}/{GITHUB_REPO}"
+
+# The version assignment in pyproject.toml, for source checkouts
+_PYPROJECT_VERSION_RE = re.compile(r'version\s*=\s*["\']([^"\']+)["\']')
+
+
+class UpdateError(Exception):
+    """Raised when update operations fail."""
+    pass
+
+
+@functools.lru_cache(maxsize=1)
+def get_current_version() -> str:
+    """Get the currently installed version of obsidian-timemachine.
+    
+    The installed version cannot change under a running process, so the
+    lookup is done once and cached.
+    
+    Returns:
+        Version string (e.g., "0.1.0").
+        
+    Raises:
+        UpdateError: If version cannot be determined.
+    """
+    try:
+        from importlib.metadata import version
+        return version("obsidian-timemachine")
+    except Exception:
+        # Fallback: try to read from pyproject.toml
+        try:
+            pyproject = Path(__file__).parent.parent / "pyproject.toml"
+            if pyproject.exists():
+                content = pyproject.read_text()
+                match = _PYPROJECT_VERSION_RE.search(content)
+                if match:
+                    return match.group(1)
+        except Exception:
+            pass
+        
+        raise UpdateError("Cannot determine current version")
@@ -0,0 +1,39 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+import subprocess
+from typing import Any, Callable
+
+import pytest
+
+
+class FakeRunner:
+    """In-process stand-in for subprocess.run.
+    
+    Records every command and returns a CompletedProcess built from the
+    configured returncode, stdout and stderr. An optional side_effect is
+    called with the same arguments first, e.g. to create files the real
+    command would have written.
+    """
+    
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+        self.returncode = 0
+        self.stdout = ""
+        self.stderr = ""
+        self.side_effect: Callable[..., Any] | None = None
+    
+    def __call__(self, cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess:
+        self.calls.append(cmd)
+        if self.side_effect is not None:
+            self.side_effect(cmd, **kwargs)
+        return subprocess.CompletedProcess(
+            cmd, self.returncode, stdout=self.stdout, stderr=self.stderr
+        )
+
+
+@pytest.fixture
+def fake_runner() -> FakeRunner:
+    """Provide a configurable fake for functions that accept a runner."""
+    return FakeRunner()
@@ -0,0 +1,42 @@
+"""Tests for the CLI entry point."""
+
+from click.testing import CliRunner
+
+from ot.cli.main import COMMANDS, cli
+from ot.cli._cmds.schedule import _FREQS
+from ot.scheduler import SCHEDULE_PRESETS
+
+
+class TestLazyCommands:
+    """Tests for lazy subcommand registration."""
+    
+    def test_all_commands_resolve(self) -> None:
+        """Test that every registered command can be imported."""
+        for name in COMMANDS:
+            assert cli.get_command(None, name) is not None
+    
+    def test_unknown_command(self) -> None:
+        """Test that unknown commands are rejected."""
+        result = CliRunner().invoke(cli, ["nope"])
+        assert result.exit_code != 0
+
+
+class TestScheduleSet:
+    """Tests for the 'schedule set' command."""
+    
+    def test_frequencies_are_presets(self) -> None:
+        """Test that every CLI frequency maps to a schedule preset."""
+        assert set(_FREQS) <= set(SCHEDULE_PRESETS)
+    
+    def test_frequency_case_insensitive(self, monkeypatch) -> None:
+        """Test that frequencies are accepted regardless of case."""
+        calls = []
+        monkeypatch.setattr(
+            "ot.scheduler.add_sync_schedule",
+            lambda frequency: calls.append(frequency) or True,
+        )
+        
+        result = CliRunner().invoke(cli, ["schedule", "set", "HOURLY"])
+        
+        assert result.exit_code == 0
+        assert calls == ["hourly"]
@@ -2,6 +2,7 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -50,6 +51,14 @@ class TestConfig:
         assert isinstance(config.source_dir, Path)
         assert isinstance(config.dest_dir, Path)
     
+    def test_config_string_paths_expanded(self, tmp_path: Path) -> None:
+        """Test that string paths are expanded and made absolute."""
+        config = Config(source_dir="~/vault", dest_dir="backup")
+        
+        assert config.source_dir == Path.home() / "vault"
+        assert config.dest_dir == Path.cwd() / "backup"
+        assert config.ssh_key_path is None
+    
     def test_config_to_dict(self, tmp_path: Path) -> None:
         """Test converting config to dictionary."""
         source = tmp_path / "source"
@@ -115,6 +124,34 @@ class TestLoadConfig:
         
         with pytest.raises(ConfigError, match="Missing required field"):
             load_config(config_file)
+    
+    def test_load_config_returns_cached_copy(self, tmp_path: Path) -> None:
+        """Test that repeat loads reuse the parse but return fresh objects."""
+        config_file = tmp_path / "config.yaml"
+        save_config(Config(source_dir=tmp_path, dest_dir=tmp_path), config_file)
+        
+        first = load_config(config_file)
+        first.log_retention_days = 99
+        
+        with patch("ot.config._yaml_codec") as mock_codec:
+            second = load_config(config_file)
+        
+        mock_codec.assert_not_called()
+        assert second is not first
+        assert second.log_retention_days == DEFAULT_LOG_RETENTION_DAYS
+    
+    def test_save_config_invalidates_cache(self, tmp_path: Path) -> None:
+        """Test that saving a config drops the cached copy."""
+        config_file = tmp_path / "config.yaml"
+        save_config(Config(source_dir=tmp_path, dest_dir=tmp_path), config_file)
+        load_config(config_file)
+        
+        save_config(
+            Config(source_dir=tmp_path, dest_dir=tmp_path, log_retention_days=3),
+            config_file,
+        )
+        
+        assert load_config(config_file).log_retention_days == 3
 
 
 class TestSaveConfig:
@@ -157,6 +194,19 @@ class TestSaveConfig:
         save_config(config, config_file)
         
         assert config_file.exists()
+    
+    def test_save_config_is_private_and_atomic(self, tmp_path: Path) -> None:
+        """Test that the saved file is mode 600 and no temp file is left."""
+        config = Config(source_dir=tmp_path, dest_dir=tmp_path)
+        
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("stale")
+        config_file.chmod(0o644)
+        save_config(config, config_file)
+        
+        assert config_file.stat().st_mode & 0o777 == 0o600
+        assert load_config(config_file).dest_dir == tmp_path
+        assert list(tmp_path.iterdir()) == [config_file]
 
 
 class TestValidateConfig:
@@ -7,16 +7,22 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from ot.git_ops import (
+    GitBatch,
     GitResult,
+    _run_git,
     add_all,
     check_git_available,
     commit,
+    fetch,
     get_current_branch,
     get_remote_url,
     has_changes,
     has_commits,
     init_repo,
     is_git_repo,
+    merge,
+    probe_git,
+    pull,
     set_remote_url,
 )
 
@@ -119,6 +125,17 @@ class TestHasChanges:
         
         # No files, no changes
         assert not has_changes(tmp_path)
+    
+    def test_has_changes_ignores_touched_files(self, cloned_repo: tuple[Path, Path]) -> None:
+        """Test that a file rewritten with identical content is not a change."""
+        local, _ = cloned_repo
+        (local / "a.md").write_text("a")
+        
+        with patch("ot.git_ops._pygit2", return_value=None):
+            assert not has_changes(local)
+            
+            (local / "new.md").write_text("new")
+            assert has_changes(local)
 
 
 class TestHasCommits:
@@ -169,6 +186,17 @@ class TestRemoteOperations:
         
         url = get_remote_url(tmp_path)
         assert url == test_url
+    
+    def test_probe_git(self, tmp_path: Path) -> None:
+        """Test probing repository state and remote in one call."""
+        assert probe_git(tmp_path) == (False, None)
+        
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
+        assert probe_git(tmp_path) == (True, None)
+        
+        test_url = "git@github.com:test/repo.git"
+        set_remote_url(tmp_path, test_url)
+        assert probe_git(tmp_path) == (True, test_url)
 
 
 class TestCommitOperations:
@@ -209,6 +237,240 @@ class TestCommitOperations:
         
         assert result.success
         assert has_commits(tmp_path)
+    
+    def test_commit_without_identity(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that a default identity is configured when git has none."""
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", "/dev/null")
+        monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+        monkeypatch.setenv("GIT_CONFIG_COUNT", "1")
+        monkeypatch.setenv("GIT_CONFIG_KEY_0", "user.useConfigOnly")
+        monkeypatch.setenv("GIT_CONFIG_VALUE_0", "true")
+        for var in ("EMAIL", "GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+            monkeypatch.delenv(var, raising=False)
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
+        
+        (tmp_path / "test.txt").write_text("test content")
+        add_all(tmp_path)
+        result = commit(tmp_path, "Test commit")
+        
+        assert result.success
+        email = subprocess.run(
+            ["git", "config", "user.email"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+        )
+        assert email.stdout.strip() == "obsidian-timemachine@local"
+
+
+@pytest.fixture
+def cloned_repo(tmp_path: Path, monkeypatch) -> tuple[Path, Path]:
+    """Create a bare 'origin' with one commit and two clones of it.
+    
+    Returns:
+        Tuple of (local clone under test, second clone used to push).
+    """
+    for var, value in (
+        ("GIT_AUTHOR_NAME", "Test"),
+        ("GIT_AUTHOR_EMAIL", "test@test.com"),
+        ("GIT_COMMITTER_NAME", "Test"),
+        ("GIT_COMMITTER_EMAIL", "test@test.com"),
+    ):
+        monkeypatch.setenv(var, value)
+    
+    origin = tmp_path / "origin.git"
+    subprocess.run(["git", "init", "--bare", "-b", "main", str(origin)], capture_output=True)
+    
+    other = tmp_path / "other"
+    subprocess.run(["git", "clone", str(origin), str(other)], capture_output=True)
+    subprocess.run(["git", "checkout", "-b", "main"], cwd=other, capture_output=True)
+    (other / "a.md").write_text("a")
+    subprocess.run(["git", "add", "."], cwd=other, capture_output=True)
+    subprocess.run(["git", "commit", "-m", "a"], cwd=other, capture_output=True)
+    subprocess.run(["git", "push", "-u", "origin", "main"], cwd=other, capture_output=True)
+    
+    local = tmp_path / "local"
+    subprocess.run(["git", "clone", str(origin), str(local)], capture_output=True)
+    
+    return local, other
+
+
+class TestPull:
+    """Tests for pull function."""
+    
+    def test_pull_up_to_date(self, cloned_repo: tuple[Path, Path]) -> None:
+        """Test pulling when local already matches the remote."""
+        local, _ = cloned_repo
+        
+        result = pull(local, branch="main")
+        
+        assert result.success
+    
+    def test_pull_brings_remote_commits(self, cloned_repo: tuple[Path, Path]) -> None:
+        """Test pulling new commits from the remote."""
+        local, other = cloned_repo
+        (other / "b.md").write_text("b")
+        subprocess.run(["git", "add", "."], cwd=other, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "b"], cwd=other, capture_output=True)
+        subprocess.run(["git", "push"], cwd=other, capture_output=True)
+        
+        result = pull(local, branch="main")
+        
+        assert result.success
+        assert (local / "b.md").exists()
+    
+    def test_pull_merges_diverged_branch(self, cloned_repo: tuple[Path, Path]) -> None:
+        """Test that a non-fast-forward pull falls back to a merge."""
+        local, other = cloned_repo
+        for repo, name in ((other, "b.md"), (local, "c.md")):
+            (repo / name).write_text(name)
+            subprocess.run(["git", "add", "."], cwd=repo, capture_output=True)
+            subprocess.run(["git", "commit", "-m", name], cwd=repo, capture_output=True)
+        subprocess.run(["git", "push"], cwd=other, capture_output=True)
+        
+        with patch("ot.git_ops.merge", wraps=merge) as mock_merge:
+            result = pull(local, branch="main")
+        
+        assert result.success
+        mock_merge.assert_called_once_with(local, "origin/main")
+        assert (local / "b.md").exists()
+        assert (local / "c.md").exists()
+    
+    def test_pull_aborts_conflicting_merge(self, cloned_repo: tuple[Path, Path]) -> None:
+        """Test that a conflicting merge is aborted and reported."""
+        local, other = cloned_repo
+        for repo, text in ((other, "theirs"), (local, "ours")):
+            (repo / "a.md").write_text(text)
+            subprocess.run(["git", "commit", "-am", text], cwd=repo, capture_output=True)
+        subprocess.run(["git", "push"], cwd=other, capture_output=True)
+        
+        with patch("ot.git_ops._run_git", wraps=_run_git) as mock_run:
+            result = pull(local, branch="main")
+        
+        assert not result.success
+        assert ["merge", "--abort"] in [c.args[0] for c in mock_run.call_args_list]
+        assert ["status"] not in [c.args[0] for c in mock_run.call_args_list]
+        assert not (local / ".git" / "MERGE_HEAD").exists()
+        assert (local / "a.md").read_text() == "ours"
+    
+    def test_pull_ignores_pull_rebase_config(self, cloned_repo: tuple[Path, Path]) -> None:
+        """Test that a diverged branch is merged even with pull.rebase set."""
+        local, other = cloned_repo
+        subprocess.run(["git", "config", "pull.rebase", "true"], cwd=local, capture_output=True)
+        for repo, name in ((other, "b.md"), (local, "c.md")):
+            (repo / name).write_text(name)
+            subprocess.run(["git", "add", "."], cwd=repo, capture_output=True)
+            subprocess.run(["git", "commit", "-m", name], cwd=repo, capture_output=True)
+        subprocess.run(["git", "push"], cwd=other, capture_output=True)
+        
+        result = pull(local, branch="main")
+        
+        parents = subprocess.run(
+            ["git", "rev-list", "--parents", "-n", "1", "HEAD"],
+            cwd=local,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        assert result.success
+        assert len(parents) == 3
+    
+    def test_pull_unreachable_remote_fails_once(
+        self, cloned_repo: tuple[Path, Path], tmp_path: Path
+    ) -> None:
+        """Test that a transport failure is reported after a single fetch."""
+        local, _ = cloned_repo
+        subprocess.run(
+            ["git", "remote", "set-url", "origin", str(tmp_path / "gone.git")],
+            cwd=local,
+            capture_output=True,
+        )
+        
+        with patch("ot.git_ops.fetch", wraps=fetch) as mock_fetch, \
+             patch("ot.git_ops.merge") as mock_merge:
+            result = pull(local, branch="main")
+        
+        assert not result.success
+        mock_fetch.assert_called_once()
+        mock_merge.assert_not_called()
+    
+    def test_pull_missing_remote_branch(self, cloned_repo: tuple[Path, Path]) -> None:
+        """Test that pulling a branch the remote lacks fails without merging."""
+        local, _ = cloned_repo
+        
+        with patch("ot.git_ops.merge") as mock_merge:
+            result = pull(local, branch="nope")
+        
+        assert not result.success
+        mock_merge.assert_not_called()
+
+
+class TestGitBatch:
+    """Tests for the GitBatch revision resolver."""
+    
+    def test_resolve(self, cloned_repo: tuple[Path, Path]) -> None:
+        """Test resolving existing and missing revisions."""
+        local, _ = cloned_repo
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=local,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        
+        with GitBatch(local) as batch:
+            assert batch.resolve("HEAD") == head
+            assert batch.resolve("origin/main") == head
+            assert batch.resolve("origin/nope") is None
+    
+    def test_has_commits_uses_batch(self, tmp_path: Path) -> None:
+        """Test that has_commits does not spawn git while a batch is open."""
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
+        
+        with GitBatch(tmp_path), \
+             patch("ot.git_ops._pygit2", return_value=None), \
+             patch("ot.git_ops._run_git") as mock_run:
+            assert not has_commits(tmp_path)
+        
+        mock_run.assert_not_called()
+    
+    def test_falls_back_after_close(self, tmp_path: Path) -> None:
+        """Test that lookups spawn git again once the batch is closed."""
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
+        
+        with GitBatch(tmp_path):
+            pass
+        
+        with patch("ot.git_ops._pygit2", return_value=None):
+            assert not has_commits(tmp_path)
+
+
+class TestPygit2Backend:
+    """Tests for the optional in-process pygit2 queries."""
+    
+    def test_queries_use_open_repo(self, tmp_path: Path) -> None:
+        """Test that read-only queries skip git when a repo object is available."""
+        repo = MagicMock()
+        repo.references.get.return_value.target = "refs/heads/main"
+        repo.remotes.__getitem__.return_value.url = "git@github.com:test/repo.git"
+        repo.head_is_unborn = False
+        repo.status.return_value = {}
+        
+        with patch("ot.git_ops._open_repo", return_value=repo), \
+             patch("ot.git_ops._run_git") as mock_run:
+            assert get_current_branch(tmp_path) == "main"
+            assert get_remote_url(tmp_path) == "git@github.com:test/repo.git"
+            assert has_commits(tmp_path)
+            assert not has_changes(tmp_path)
+        
+        mock_run.assert_not_called()
+    
+    def test_falls_back_without_pygit2(self, tmp_path: Path) -> None:
+        """Test that queries fall back to git when pygit2 is missing."""
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
+        
+        with patch("ot.git_ops._pygit2", return_value=None):
+            assert not has_commits(tmp_path)
+            assert get_remote_url(tmp_path) is None
 
 
 class TestGitResult:
@@ -218,10 +480,12 @@ class TestGitResult:
         """Test creating a GitResult."""
         result = GitResult(
             success=True,
-            output="output",
-            error="",
+            stdout="output ✅".encode(),
+            stderr=b"",
             exit_code=0,
         )
         
         assert result.success
         assert result.exit_code == 0
+        assert result.output == "output ✅"
+        assert result.error == ""
@@ -8,6 +8,7 @@ from pathlib import Path
 import pytest
 
 from ot.logger import (
+    ColoredFormatter,
     get_log_file_path,
     get_logger,
     rotate_logs,
@@ -104,6 +105,20 @@ class TestRotateLogs:
         assert deleted == 0
         assert recent_log.exists()
     
+    def test_rotate_ignores_other_files(self, tmp_path: Path) -> None:
+        """Test that files not named like daily logs are left alone."""
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        
+        others = [log_dir / name for name in ("backup-old.log", "notes.log", "backup-2000-01-01.txt")]
+        for other in others:
+            other.write_text("keep")
+        
+        deleted = rotate_logs(log_dir, retention_days=7)
+        
+        assert deleted == 0
+        assert all(other.exists() for other in others)
+    
     def test_rotate_empty_dir(self, tmp_path: Path) -> None:
         """Test rotate_logs with empty directory."""
         log_dir = tmp_path / "logs"
@@ -122,6 +137,21 @@ class TestRotateLogs:
         assert deleted == 0
 
 
+class TestColoredFormatter:
+    """Tests for ColoredFormatter."""
+    
+    def test_set_color(self) -> None:
+        """Test that set_color overrides the terminal check."""
+        formatter = ColoredFormatter("%(message)s")
+        record = logging.LogRecord("t", logging.ERROR, "", 0, "boom", None, None)
+        
+        formatter.set_color(True)
+        assert formatter.format(record) == "\033[31mboom\033[0m"
+        
+        formatter.set_color(False)
+        assert formatter.format(record) == "boom"
+
+
 class TestGetLogger:
     """Tests for get_logger function."""
     
@@ -0,0 +1,158 @@
+"""Tests for the sync runner."""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ot.config import Config
+from ot.git_ops import GitResult
+from ot.runner import SyncResult, SyncRunner, _GitState, main
+from ot.sync import RsyncResult
+
+
+def git_result(success: bool = True, stderr: bytes = b"") -> GitResult:
+    """Build a GitResult with empty output."""
+    return GitResult(success=success, stdout=b"", stderr=stderr, exit_code=0 if success else 1)
+
+
+@pytest.fixture
+def runner(tmp_path: Path) -> SyncRunner:
+    """A SyncRunner over two temporary directories."""
+    source = tmp_path / "source"
+    dest = tmp_path / "dest"
+    source.mkdir()
+    dest.mkdir()
+    return SyncRunner(config=Config(source_dir=source, dest_dir=dest, log_dir=tmp_path / "logs"))
+
+
+@pytest.fixture
+def stubs():
+    """Replace every Git, iCloud and rsync call made by _sync_and_push."""
+    rsync = RsyncResult(success=True, exit_code=0, stdout="", stderr="")
+    with patch("ot.runner.pull", return_value=git_result()) as pull, \
+            patch("ot.runner.wait_for_icloud_sync") as wait, \
+            patch("ot.runner.has_commits", return_value=True) as has_commits, \
+            patch("ot.runner.run_rsync", return_value=rsync) as run_rsync, \
+            patch("ot.runner.copy_directory_initial", return_value=rsync) as copy, \
+            patch("ot.runner.commit_and_push", return_value=git_result()) as push:
+        yield MagicMock(
+            pull=pull,
+            wait=wait,
+            has_commits=has_commits,
+            run_rsync=run_rsync,
+            copy=copy,
+            push=push,
+        )
+
+
+def probe(runner: SyncRunner, has_commits: bool, remote_url: str | None = "git@host:r.git"):
+    """Make _probe_git report the given repository state."""
+    state = _GitState(branch="main", remote_url=remote_url, has_commits=has_commits)
+    return patch.object(runner, "_probe_git", return_value=state)
+
+
+class TestSyncAndPush:
+    """Tests for SyncRunner._sync_and_push."""
+    
+    def test_pull_into_unborn_branch_refreshes_commits(self, runner, stubs) -> None:
+        """Test that history checked out by the pull is not copied over again."""
+        with probe(runner, has_commits=False):
+            result = runner._sync_and_push()
+        
+        assert result.success
+        stubs.has_commits.assert_called_once_with(runner.config.dest_dir)
+        stubs.run_rsync.assert_called_once()
+        stubs.copy.assert_not_called()
+        assert stubs.push.call_args.kwargs["is_first_push"] is False
+    
+    def test_failed_pull_keeps_first_sync(self, runner, stubs) -> None:
+        """Test that an empty repository still gets the initial copy."""
+        stubs.pull.return_value = git_result(success=False, stderr=b"offline")
+        
+        with probe(runner, has_commits=False):
+            result = runner._sync_and_push()
+        
+        assert result.success
+        stubs.has_commits.assert_not_called()
+        stubs.copy.assert_called_once()
+        assert stubs.push.call_args.kwargs["is_first_push"] is True
+    
+    def test_pull_overlaps_icloud_wait(self, runner, stubs) -> None:
+        """Test that the pull and the iCloud wait both run before rsync."""
+        with probe(runner, has_commits=True):
+            result = runner._sync_and_push()
+        
+        assert result.success
+        stubs.pull.assert_called_once()
+        stubs.wait.assert_called_once_with(
+            source_dir=runner.config.source_dir,
+            max_wait_seconds=runner.config.icloud_wait_timeout,
+        )
+        stubs.run_rsync.assert_called_once()
+    
+    def test_pull_skipped_without_remote(self, runner, stubs) -> None:
+        """Test that no pull is attempted when 'origin' is not configured."""
+        with probe(runner, has_commits=True, remote_url=None):
+            result = runner._sync_and_push()
+        
+        assert result.success
+        stubs.pull.assert_not_called()
+        stubs.wait.assert_called_once()
+        assert stubs.push.call_args.kwargs["is_first_push"] is True
+    
+    def test_pull_failure_is_a_warning(self, runner, stubs) -> None:
+        """Test that a failed pull is reported and the sync still runs."""
+        stubs.pull.return_value = git_result(success=False, stderr=b"network down")
+        
+        with probe(runner, has_commits=True):
+            result = runner._sync_and_push()
+        
+        assert result.success
+        assert result.warnings == ["Pull failed (network issue?): network down"]
+        stubs.run_rsync.assert_called_once()
+        stubs.push.assert_called_once()
+    
+    def test_same_source_and_dest_skips_wait(self, runner, stubs) -> None:
+        """Test that the iCloud wait and rsync are skipped for in-place vaults."""
+        runner.config.source_dir = runner.config.dest_dir
+        
+        with probe(runner, has_commits=True):
+            result = runner._sync_and_push()
+        
+        assert result.success
+        stubs.pull.assert_called_once()
+        stubs.wait.assert_not_called()
+        stubs.run_rsync.assert_not_called()
+
+
+class TestMain:
+    """Tests for the ``python -m ot.runner`` entry point."""
+    
+    @patch("ot.runner.run_sync")
+    def test_success_with_warnings(self, mock_run, capsys) -> None:
+        """Test that warnings are printed and the exit code is 0."""
+        mock_run.return_value = SyncResult(success=True, warnings=["pull failed"])
+        
+        assert main(["--config", "/tmp/c.yaml"]) == 0
+        
+        mock_run.assert_called_once_with(config_path=Path("/tmp/c.yaml"))
+        assert "Warning: pull failed" in capsys.readouterr().err
+    
+    @patch("ot.runner.run_sync")
+    def test_failure(self, mock_run, capsys) -> None:
+        """Test that errors are printed and the exit code is 1."""
+        mock_run.return_value = SyncResult(success=False, errors=["no config"])
+        
+        assert main([]) == 1
+        
+        mock_run.assert_called_once_with(config_path=None)
+        assert "Error: no config" in capsys.readouterr().err
+    
+    def test_does_not_import_click(self) -> None:
+        """Test that the runner module loads without the CLI framework."""
+        code = "import sys, ot.runner; sys.exit('click' in sys.modules)"
+        
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
@@ -10,6 +10,7 @@ from ot.scheduler import (
     find_ot_cron_jobs,
     describe_schedule,
     SCHEDULE_PRESETS,
+    _add_cron_schedule,
 )
 
 
@@ -78,31 +79,61 @@ class TestCronJob:
     def test_from_cron_line_comment_only(self) -> None:
         """Test parsing comment-only line."""
         assert CronJob.from_cron_line("# this is a comment") is None
+    
+    def test_from_cron_line_is_compiled_once(self) -> None:
+        """Test that parsing uses the precompiled pattern, not re.compile."""
+        with patch("re.compile", side_effect=AssertionError("compiled per call")):
+            job = CronJob.from_cron_line("0  2 * * *   ot sync  #  nightly")
+        
+        assert job is not None
+        assert job.schedule == "0 2 * * *"
+        assert job.command == "ot sync"
+        assert job.comment == "nightly"
+    
+    def test_from_cron_line_long_lines(self) -> None:
+        """Test that very long whitespace runs and commands parse correctly."""
+        job = CronJob.from_cron_line("* * * * * ot" + " " * 100_000 + "sync")
+        
+        assert job is not None
+        assert len(job.command) == 100_006
+        
+        job = CronJob.from_cron_line("*" + " " * 100_000 + "*")
+        
+        assert job is None
+    
+    def test_from_cron_line_hash_in_command(self) -> None:
+        """Test that only the last '#' starts the comment."""
+        job = CronJob.from_cron_line("0 2 * * * ot sync --config /x#y # nightly")
+        
+        assert job is not None
+        assert job.command == "ot sync --config /x#y"
+        assert job.comment == "nightly"
+        
+        job = CronJob.from_cron_line("0 2 * * * ot sync --config /x#y")
+        
+        assert job is not None
+        assert job.command == "ot sync --config /x"
+        assert job.comment == "y"
 
 
 class TestGetCurrentCrontab:
     """Tests for get_current_crontab function."""
     
-    @patch("ot.scheduler.subprocess.run")
-    def test_get_crontab_success(self, mock_run: MagicMock) -> None:
+    def test_get_crontab_success(self, fake_runner) -> None:
         """Test getting crontab successfully."""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="*/15 * * * * ot sync\n",
-        )
+        fake_runner.stdout = "*/15 * * * * ot sync\n"
+        
+        result = get_current_crontab(runner=fake_runner)
         
-        result = get_current_crontab()
         assert "ot sync" in result
+        assert fake_runner.calls == [["crontab", "-l"]]
     
-    @patch("ot.scheduler.subprocess.run")
-    def test_get_crontab_empty(self, mock_run: MagicMock) -> None:
+    def test_get_crontab_empty(self, fake_runner) -> None:
         """Test when no crontab exists."""
-        mock_run.return_value = MagicMock(
-            returncode=1,
-            stderr="no crontab for user",
-        )
+        fake_runner.returncode = 1
+        fake_runner.stderr = "no crontab for user"
         
-        result = get_current_crontab()
+        result = get_current_crontab(runner=fake_runner)
         assert result == ""
 
 
@@ -130,30 +161,100 @@ class TestFindOTCronJobs:
         
         jobs = find_ot_cron_jobs()
         assert jobs == []
+    
+    @patch("ot.scheduler.get_current_crontab")
+    def test_find_jobs_case_and_dash(self, mock_crontab: MagicMock) -> None:
+        """Test that matching ignores case and accepts 'ot-sync'."""
+        mock_crontab.return_value = (
+            "0 * * * * /usr/bin/OT SYNC\n"
+            "# 0 * * * * ot sync\n"
+            "0 2 * * * ot-sync --config /tmp/c.yaml"
+        )
+        
+        jobs = find_ot_cron_jobs()
+        
+        assert [job.command for job in jobs] == [
+            "/usr/bin/OT SYNC",
+            "ot-sync --config /tmp/c.yaml",
+        ]
+    
+    @patch("ot.scheduler.get_current_crontab")
+    def test_find_jobs_large_crontab(self, mock_crontab: MagicMock) -> None:
+        """Test that one job is picked out of a 10k-line crontab."""
+        mock_crontab.return_value = (
+            "0 * * * * some-other-command --flag\n" * 10_000
+            + "*/15 * * * * ot sync\n"
+        )
+        
+        jobs = find_ot_cron_jobs()
+        
+        assert [job.command for job in jobs] == ["ot sync"]
+
+
+class TestAddCronSchedule:
+    """Tests for _add_cron_schedule function."""
+    
+    @patch("ot.scheduler._set_crontab", return_value=True)
+    @patch("ot.scheduler.get_current_crontab")
+    def test_schedules_runner_module(
+        self, mock_crontab: MagicMock, mock_set: MagicMock
+    ) -> None:
+        """Test that cron runs the Click-free runner and replaces old jobs."""
+        mock_crontab.return_value = (
+            "0 * * * * other-command\n"
+            "*/15 * * * * /usr/bin/python3 -m ot.cli.main sync # Obsidian Timemachine auto-sync\n"
+        )
+        
+        assert _add_cron_schedule("hourly", Path("/tmp/my config.yaml"))
+        
+        lines = mock_set.call_args[0][0].splitlines()
+        assert lines[0] == "0 * * * * other-command"
+        assert len(lines) == 2
+        job = CronJob.from_cron_line(lines[1])
+        assert job.schedule == "0 * * * *"
+        assert job.command.endswith(" -m ot.runner --config '/tmp/my config.yaml'")
+        
+        mock_crontab.return_value = mock_set.call_args[0][0]
+        assert len(find_ot_cron_jobs()) == 1
 
 
 class TestDescribeSchedule:
     """Tests for describe_schedule function."""
     
-    def test_describe_15min(self) -> None:
-        """Test describing 15min preset."""
-        desc = describe_schedule(SCHEDULE_PRESETS["15min"])
-        assert "15 minutes" in desc
-    
-    def test_describe_hourly(self) -> None:
-        """Test describing hourly preset."""
-        desc = describe_schedule(SCHEDULE_PRESETS["hourly"])
-        assert "hour" in desc.lower()
-    
-    def test_describe_daily(self) -> None:
-        """Test describing daily preset."""
-        desc = describe_schedule(SCHEDULE_PRESETS["daily"])
-        assert "2:00 AM" in desc or "Daily" in desc
+    @pytest.mark.parametrize(
+        ("preset", "expected"),
+        [
+            ("15min", "15 minutes"),
+            ("hourly", "hour"),
+            ("daily", "Daily"),
+        ],
+    )
+    def test_describe_preset(self, preset: str, expected: str) -> None:
+        """Test describing preset schedules."""
+        desc = describe_schedule(SCHEDULE_PRESETS[preset])
+        assert expected in desc
     
     def test_describe_custom(self) -> None:
         """Test describing custom schedule."""
         desc = describe_schedule("*/5 * * * *")
         assert "5 minutes" in desc
+    
+    @pytest.mark.parametrize(
+        ("schedule", "expected"),
+        [
+            ("*/1 * * * *", "Every minute"),
+            ("*/45 * * * *", "Every 45 minutes"),
+            ("*/0 * * * *", "*/0 * * * *"),
+            ("*/00 * * * *", "*/00 * * * *"),
+        ],
+    )
+    def test_describe_every_n_minutes(self, schedule: str, expected: str) -> None:
+        """Test the generic "*/N" form, which needs N of at least 1."""
+        assert describe_schedule(schedule) == expected
+    
+    def test_describe_unknown_returned_verbatim(self) -> None:
+        """Test that an unrecognised expression is returned unchanged."""
+        assert describe_schedule("5 4 * * 1") == "5 4 * * 1"
 
 
 class TestSchedulePresets:
@@ -166,8 +267,12 @@ class TestSchedulePresets:
         assert "hourly" in SCHEDULE_PRESETS
         assert "daily" in SCHEDULE_PRESETS
     
-    def test_presets_valid_cron(self) -> None:
-        """Test that presets are valid cron expressions."""
-        for name, expr in SCHEDULE_PRESETS.items():
-            parts = expr.split()
-            assert len(parts) == 5, f"Invalid cron expression for {name}"
+    def test_presets_read_only(self) -> None:
+        """Test that the shared presets cannot be modified."""
+        with pytest.raises(TypeError):
+            SCHEDULE_PRESETS["hourly"] = "* * * * *"
+    
+    @pytest.mark.parametrize(("name", "expr"), list(SCHEDULE_PRESETS.items()))
+    def test_preset_valid_cron(self, name: str, expr: str) -> None:
+        """Test that a preset is a valid cron expression."""
+        assert len(expr.split()) == 5, f"Invalid cron expression for {name}"
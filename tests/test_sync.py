@@ -1,6 +1,8 @@
 """Tests for the sync module."""
 
 import subprocess
+import sys
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -9,9 +11,14 @@ import pytest
 from ot.sync import (
     RsyncExitCode,
     RsyncResult,
+    _OUTPUT_TAIL_LINES,
+    _exclude_matcher,
+    _reset_caches,
+    _run_streaming,
     build_rsync_command,
     check_rsync_available,
     check_rsync_iconv_support,
+    copy_directory_initial,
     run_rsync,
 )
 
@@ -25,6 +32,48 @@ class TestCheckRsyncAvailable:
         result = check_rsync_available()
         # We can't assert True because rsync might not be installed
         assert isinstance(result, bool)
+    
+    def test_result_is_cached(self) -> None:
+        """Test that PATH is only searched once per process."""
+        _reset_caches()
+        try:
+            with patch("ot.sync.shutil.which", return_value="/usr/bin/rsync") as mock_which:
+                assert check_rsync_available() is True
+                assert check_rsync_available() is True
+            
+            mock_which.assert_called_once_with("rsync")
+        finally:
+            _reset_caches()
+
+
+class TestCheckRsyncIconvSupport:
+    """Tests for check_rsync_iconv_support function."""
+    
+    def test_probe_is_persisted_per_binary(self, tmp_path: Path) -> None:
+        """Test that rsync --version runs once per rsync binary."""
+        caps_file = tmp_path / "rsync_caps.json"
+        version = subprocess.CompletedProcess(
+            ["rsync", "--version"], 0, stdout="rsync  version 3.2.7  iconv", stderr=""
+        )
+        
+        _reset_caches()
+        try:
+            with patch("ot.sync._CAPS_CACHE_FILE", caps_file), \
+                 patch("ot.sync._rsync_binary_key", return_value="/bin/rsync:1:2"), \
+                 patch("ot.sync.subprocess.run", return_value=version) as mock_run:
+                assert check_rsync_iconv_support() is True
+                _reset_caches()
+                assert check_rsync_iconv_support() is True
+                
+                mock_run.assert_called_once()
+                
+                with patch("ot.sync._rsync_binary_key", return_value="/bin/rsync:3:4"):
+                    _reset_caches()
+                    check_rsync_iconv_support()
+                
+                assert mock_run.call_count == 2
+        finally:
+            _reset_caches()
 
 
 class TestBuildRsyncCommand:
@@ -40,6 +89,8 @@ class TestBuildRsyncCommand:
         assert cmd[0] == "rsync"
         assert "-av" in cmd
         assert "--progress" in cmd
+        assert "--whole-file" in cmd
+        assert "--inplace" not in cmd
         assert f"{source}/" in cmd
         assert str(dest) in cmd
     
@@ -158,6 +209,186 @@ class TestRunRsync:
         
         assert not result.success
         assert "not found" in result.stderr
+    
+    @patch("ot.sync.check_rsync_iconv_support", return_value=False)
+    @patch("ot.sync.check_rsync_available", return_value=True)
+    @patch("ot.sync._run_streaming")
+    def test_exit_code_outcomes(
+        self,
+        mock_stream: MagicMock,
+        mock_available: MagicMock,
+        mock_iconv: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test that exit codes map to success, warnings and failures."""
+        mock_stream.return_value = (24, "", "file vanished")
+        result = run_rsync(tmp_path, tmp_path)
+        assert result.success is True
+        assert "vanished" in result.warning
+        
+        mock_stream.return_value = (12, "", "protocol error")
+        result = run_rsync(tmp_path, tmp_path)
+        assert result.success is False
+        assert result.warning is None
+    
+    @patch("ot.sync.time.sleep")
+    @patch("ot.sync.check_rsync_iconv_support", return_value=False)
+    @patch("ot.sync.check_rsync_available", return_value=True)
+    @patch("ot.sync._run_streaming")
+    def test_resource_deadlock_is_retried(
+        self,
+        mock_stream: MagicMock,
+        mock_available: MagicMock,
+        mock_iconv: MagicMock,
+        mock_sleep: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test that exit code 20 is retried before succeeding."""
+        mock_stream.side_effect = [(20, "", "deadlock"), (0, "done", "")]
+        
+        result = run_rsync(tmp_path, tmp_path)
+        
+        assert result.success is True
+        assert mock_stream.call_count == 2
+
+
+class TestRunStreaming:
+    """Tests for _run_streaming helper."""
+    
+    def test_keeps_only_output_tail(self) -> None:
+        """Test that long output is truncated to the last lines."""
+        script = (
+            "import sys\n"
+            "for i in range(1000): print(i)\n"
+            "print('oops', file=sys.stderr)\n"
+            "sys.exit(23)\n"
+        )
+        
+        exit_code, stdout, stderr = _run_streaming([sys.executable, "-c", script], 30)
+        
+        lines = stdout.splitlines()
+        assert exit_code == 23
+        assert len(lines) == _OUTPUT_TAIL_LINES
+        assert lines[-1] == "999"
+        assert stderr == "oops"
+    
+    def test_timeout_kills_process(self) -> None:
+        """Test that a process running past the timeout is killed."""
+        cmd = [sys.executable, "-c", "import time; time.sleep(30)"]
+        
+        with pytest.raises(subprocess.TimeoutExpired):
+            _run_streaming(cmd, 0.5)
+    
+    def test_inherited_pipe_does_not_hang(self, monkeypatch) -> None:
+        """Test that a child holding the pipes open doesn't block the return."""
+        monkeypatch.setattr("ot.sync._READER_JOIN_TIMEOUT", 0.5)
+        script = (
+            "import subprocess, sys\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(10)'])\n"
+            "print('done', flush=True)\n"
+        )
+        
+        started = time.monotonic()
+        exit_code, stdout, _ = _run_streaming([sys.executable, "-c", script], 30)
+        
+        assert exit_code == 0
+        assert stdout == "done"
+        assert time.monotonic() - started < 5
+
+
+class TestExcludeMatcher:
+    """Tests for _exclude_matcher helper."""
+    
+    def test_exact_names_and_wildcards(self) -> None:
+        """Test that plain names match exactly and wildcards via fnmatch."""
+        is_excluded = _exclude_matcher((".git", "*.icloud", "tmp[0-9]"))
+        
+        assert is_excluded(".git", ".git")
+        assert is_excluded("note.md.icloud", "a/note.md.icloud")
+        assert is_excluded("tmp1", "tmp1")
+        assert not is_excluded(".github", ".github")
+        assert not is_excluded("note.md", "note.md")
+    
+    @pytest.mark.parametrize(("rel_path", "expected"), [
+        ("Templates/drafts", True),
+        ("work/Templates/drafts", True),
+        ("Templates/drafts.md", False),
+        ("drafts", False),
+        ("archive/2023", True),
+        ("old/archive/2023", False),
+    ])
+    def test_path_patterns(self, rel_path: str, expected: bool) -> None:
+        """Test that patterns with '/' match the path, anchored by a leading '/'."""
+        is_excluded = _exclude_matcher(("Templates/drafts/", "/archive/*"))
+        
+        assert is_excluded(rel_path.rsplit("/", 1)[-1], rel_path) is expected
+
+
+class TestCopyDirectoryInitial:
+    """Tests for copy_directory_initial function."""
+    
+    def test_copies_tree_and_skips_excludes(self, tmp_path: Path) -> None:
+        """Test that nested files are copied and excluded names are not."""
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        (source / "notes" / "daily").mkdir(parents=True)
+        (source / "notes" / "daily" / "today.md").write_text("today")
+        (source / "index.md").write_text("index")
+        (source / "notes" / ".DS_Store").write_text("junk")
+        (source / "draft.md.icloud").write_text("placeholder")
+        (source / ".git").mkdir()
+        (source / ".git" / "HEAD").write_text("ref")
+        (source / ".trash").mkdir()
+        (source / ".trash" / "old.md").write_text("old")
+        (source / "cache").mkdir()
+        (source / "cache" / "blob").write_text("blob")
+        dest.mkdir()
+        
+        result = copy_directory_initial(source, dest, exclude_patterns=["cache"])
+        
+        assert result.success is True
+        assert (dest / "notes" / "daily" / "today.md").read_text() == "today"
+        assert (dest / "index.md").read_text() == "index"
+        assert not (dest / "notes" / ".DS_Store").exists()
+        assert not (dest / "draft.md.icloud").exists()
+        assert not (dest / ".git").exists()
+        assert not (dest / ".trash").exists()
+        assert not (dest / "cache").exists()
+    
+    def test_skips_path_excludes(self, tmp_path: Path) -> None:
+        """Test that an exclude containing a path applies below the source."""
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        (source / "Templates" / "drafts").mkdir(parents=True)
+        (source / "Templates" / "drafts" / "wip.md").write_text("wip")
+        (source / "Templates" / "daily.md").write_text("daily")
+        (source / "drafts").mkdir()
+        (source / "drafts" / "keep.md").write_text("keep")
+        dest.mkdir()
+        
+        result = copy_directory_initial(
+            source, dest, exclude_patterns=["Templates/drafts"]
+        )
+        
+        assert result.success is True
+        assert not (dest / "Templates" / "drafts").exists()
+        assert (dest / "Templates" / "daily.md").exists()
+        assert (dest / "drafts" / "keep.md").exists()
+    
+    def test_symlinks_are_not_followed(self, tmp_path: Path) -> None:
+        """Test that symlinked directories are copied as links."""
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        (source / "real").mkdir(parents=True)
+        (source / "real" / "note.md").write_text("note")
+        (source / "link").symlink_to("real")
+        dest.mkdir()
+        
+        result = copy_directory_initial(source, dest)
+        
+        assert result.success is True
+        assert (dest / "link").is_symlink()
+        assert (dest / "real" / "note.md").read_text() == "note"
 
 
 class TestRsyncResult:
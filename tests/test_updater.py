@@ -5,8 +5,13 @@ Tests for the updater module.
 from __future__ import annotations
 
 import json
+import logging
 import subprocess
+import time
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import MagicMock, patch
+from urllib.error import HTTPError, URLError
 
 import pytest
 
@@ -19,74 +24,77 @@ from ot.updater import (
     check_for_updates,
     perform_update,
     get_update_command,
+    _clear_check_cache,
     _fetch_github_api,
 )
 
 
+# Canned urlopen failures, built once and raised by several tests
+_E304 = HTTPError("https://api.github.com/test", 304, "Not Modified", {}, None)
+_E403 = HTTPError("https://api.github.com/test", 403, "Forbidden", {}, None)
+_E404 = HTTPError("https://api.github.com/test", 404, "Not Found", {}, None)
+_ENET = URLError("Connection refused")
+
+# Read-only GitHub release payload shared by the update check tests
+_LATEST = MappingProxyType({
+    "tag_name": "v0.2.0",
+    "html_url": "https://github.com/test/repo/releases/tag/v0.2.0",
+    "body": "New features",
+    "published_at": "2024-01-01T00:00:00Z",
+})
+
+
+@pytest.fixture(autouse=True)
+def fresh_check_cache():
+    """Start and end every test without a cached update check."""
+    _clear_check_cache()
+    yield
+    _clear_check_cache()
+
+
 class TestParseVersion:
     """Tests for parse_version function."""
     
-    def test_simple_version(self):
-        """Test parsing simple semantic version."""
-        assert parse_version("1.2.3") == (1, 2, 3)
-    
-    def test_version_with_v_prefix(self):
-        """Test parsing version with 'v' prefix."""
-        assert parse_version("v1.2.3") == (1, 2, 3)
-    
-    def test_version_with_prerelease(self):
-        """Test parsing version with pre-release suffix."""
-        assert parse_version("1.2.3-beta") == (1, 2, 3)
-        assert parse_version("1.2.3-rc1") == (1, 2, 3)
-    
-    def test_version_with_build_metadata(self):
-        """Test parsing version with build metadata."""
-        assert parse_version("1.2.3+build.123") == (1, 2, 3)
-    
-    def test_two_part_version(self):
-        """Test parsing two-part version."""
-        assert parse_version("1.2") == (1, 2)
-    
-    def test_single_part_version(self):
-        """Test parsing single-part version."""
-        assert parse_version("1") == (1,)
-    
-    def test_zero_version(self):
-        """Test parsing zero version."""
-        assert parse_version("0.0.0") == (0, 0, 0)
+    @pytest.mark.parametrize("s,expected", [
+        ("1.2.3", (1, 2, 3)),
+        ("v1.2.3", (1, 2, 3)),
+        ("1.2.3-beta", (1, 2, 3)),
+        ("1.2.3-rc1", (1, 2, 3)),
+        ("1.2.3+build.123", (1, 2, 3)),
+        ("1.2", (1, 2)),
+        ("1", (1,)),
+        ("0.0.0", (0, 0, 0)),
+        ("1.2rc1.3", (1, 2, 3)),
+        ("1.x.3", (1, 3)),
+        ("unknown", (0,)),
+    ])
+    def test_parse(self, s, expected):
+        """Test parsing prefixed, suffixed and short version strings."""
+        assert parse_version(s) == expected
 
 
 class TestCompareVersions:
     """Tests for compare_versions function."""
     
-    def test_equal_versions(self):
-        """Test comparing equal versions."""
-        assert compare_versions("1.0.0", "1.0.0") == 0
-        assert compare_versions("v1.0.0", "1.0.0") == 0
-    
-    def test_first_version_smaller(self):
-        """Test when first version is smaller."""
-        assert compare_versions("1.0.0", "1.0.1") == -1
-        assert compare_versions("1.0.0", "1.1.0") == -1
-        assert compare_versions("1.0.0", "2.0.0") == -1
-    
-    def test_first_version_larger(self):
-        """Test when first version is larger."""
-        assert compare_versions("1.0.1", "1.0.0") == 1
-        assert compare_versions("1.1.0", "1.0.0") == 1
-        assert compare_versions("2.0.0", "1.0.0") == 1
-    
-    def test_different_length_versions(self):
-        """Test comparing versions with different lengths."""
-        assert compare_versions("1.0", "1.0.0") == 0
-        assert compare_versions("1.0.0", "1.0") == 0
-        assert compare_versions("1.0", "1.0.1") == -1
-        assert compare_versions("1.0.1", "1.0") == 1
-    
-    def test_with_v_prefix(self):
-        """Test comparing versions with 'v' prefix."""
-        assert compare_versions("v1.0.0", "v1.0.1") == -1
-        assert compare_versions("v1.0.1", "1.0.0") == 1
+    @pytest.mark.parametrize("a,b,expected", [
+        ("1.0.0", "1.0.0", 0),
+        ("v1.0.0", "1.0.0", 0),
+        ("1.0.0", "1.0.1", -1),
+        ("1.0.0", "1.1.0", -1),
+        ("1.0.0", "2.0.0", -1),
+        ("1.0.1", "1.0.0", 1),
+        ("1.1.0", "1.0.0", 1),
+        ("2.0.0", "1.0.0", 1),
+        ("1.0", "1.0.0", 0),
+        ("1.0.0", "1.0", 0),
+        ("1.0", "1.0.1", -1),
+        ("1.0.1", "1.0", 1),
+        ("v1.0.0", "v1.0.1", -1),
+        ("v1.0.1", "1.0.0", 1),
+    ])
+    def test_compare(self, a, b, expected):
+        """Test ordering across prefixes and differing lengths."""
+        assert compare_versions(a, b) == expected
 
 
 class TestUpdateInfo:
@@ -121,24 +129,59 @@ class TestUpdateInfo:
 class TestGetCurrentVersion:
     """Tests for get_current_version function."""
     
+    @pytest.fixture(autouse=True)
+    def fresh_version(self):
+        """Drop the cached version around each test."""
+        get_current_version.cache_clear()
+        yield
+        get_current_version.cache_clear()
+    
     @patch("importlib.metadata.version")
     def test_get_version_from_metadata(self, mock_version):
         """Test getting version from importlib.metadata."""
         mock_version.return_value = "0.1.0"
         
         result = get_current_version()
+        
         assert result == "0.1.0"
         mock_version.assert_called_with("obsidian-timemachine")
+    
+    @patch("importlib.metadata.version")
+    def test_version_is_cached(self, mock_version):
+        """Test that the metadata lookup happens once per process."""
+        mock_version.return_value = "0.1.0"
+        
+        assert get_current_version() == get_current_version() == "0.1.0"
+        mock_version.assert_called_once()
+    
+    @patch("importlib.metadata.version", side_effect=Exception("not installed"))
+    def test_falls_back_to_pyproject(self, mock_version):
+        """Test reading the version from pyproject.toml when not installed."""
+        assert parse_version(get_current_version()) > (0,)
 
 
 class TestFetchGitHubAPI:
     """Tests for _fetch_github_api function."""
     
+    @pytest.fixture(autouse=True)
+    def api_cache(self, tmp_path: Path):
+        """Point the response cache at a temporary file."""
+        cache_file = tmp_path / "github_api.json"
+        with patch("ot.updater._API_CACHE_FILE", cache_file):
+            yield cache_file
+    
+    @pytest.fixture(autouse=True)
+    def no_pool(self):
+        """Use urlopen even when urllib3 is installed."""
+        with patch("ot.updater._urllib3_pool", return_value=None):
+            yield
+    
     @patch("ot.updater.urlopen")
     def test_successful_fetch(self, mock_urlopen):
         """Test successful API fetch."""
         mock_response = MagicMock()
         mock_response.read.return_value = b'{"tag_name": "v0.2.0"}'
+        mock_response.headers = {}
         mock_response.__enter__ = MagicMock(return_value=mock_response)
         mock_response.__exit__ = MagicMock(return_value=False)
         mock_urlopen.return_value = mock_response
@@ -150,15 +193,7 @@ class TestFetchGitHubAPI:
     @patch("ot.updater.urlopen")
     def test_404_error(self, mock_urlopen):
         """Test handling 404 error."""
-        from urllib.error import HTTPError
-        
-        mock_urlopen.side_effect = HTTPError(
-            url="https://api.github.com/test",
-            code=404,
-            msg="Not Found",
-            hdrs={},
-            fp=None,
-        )
+        mock_urlopen.side_effect = _E404
         
         with pytest.raises(UpdateError, match="not found"):
             _fetch_github_api("/repos/test/repo/releases/latest")
@@ -166,15 +201,7 @@ class TestFetchGitHubAPI:
     @patch("ot.updater.urlopen")
     def test_rate_limit_error(self, mock_urlopen):
         """Test handling rate limit error."""
-        from urllib.error import HTTPError
-        
-        mock_urlopen.side_effect = HTTPError(
-            url="https://api.github.com/test",
-            code=403,
-            msg="Forbidden",
-            hdrs={},
-            fp=None,
-        )
+        mock_urlopen.side_effect = _E403
         
         with pytest.raises(UpdateError, match="rate limit"):
             _fetch_github_api("/repos/test/repo/releases/latest")
@@ -182,78 +209,212 @@ class TestFetchGitHubAPI:
     @patch("ot.updater.urlopen")
     def test_network_error(self, mock_urlopen):
         """Test handling network error."""
-        from urllib.error import URLError
-        
-        mock_urlopen.side_effect = URLError("Connection refused")
+        mock_urlopen.side_effect = _ENET
         
         with pytest.raises(UpdateError, match="Network error"):
             _fetch_github_api("/repos/test/repo/releases/latest")
+    
+    @patch("ot.updater.urlopen")
+    def test_not_modified_uses_cached_body(self, mock_urlopen, api_cache):
+        """Test that a 304 reuses the body stored with the ETag."""
+        mock_response = MagicMock()
+        mock_response.read.return_value = b'{"tag_name": "v0.2.0"}'
+        mock_response.headers = {"ETag": '"abc"'}
+        mock_response.__enter__ = MagicMock(return_value=mock_response)
+        mock_response.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = mock_response
+        
+        _fetch_github_api("/repos/test/repo/releases/latest")
+        
+        mock_urlopen.return_value = None
+        mock_urlopen.side_effect = _E304
+        
+        result = _fetch_github_api("/repos/test/repo/releases/latest")
+        
+        request = mock_urlopen.call_args[0][0]
+        assert request.get_header("If-none-match") == '"abc"'
+        assert result == {"tag_name": "v0.2.0"}
+    
+    @pytest.mark.parametrize("contents", [
+        '{"responses": {',
+        '{"responses": {"https://api.github.com/a": {"body": {"tag_name": "v0.1.0"}}}}',
+        '{"responses": {"https://api.github.com/a": {"etag": "x"}}}',
+        '{"responses": {"https://api.github.com/a": "x"}}',
+        '{"responses": {}, "rate_limit_reset": "soon"}',
+    ])
+    @patch("ot.updater.urlopen")
+    def test_corrupt_cache_falls_back_to_fetch(self, mock_urlopen, api_cache, contents):
+        """Test that malformed cache entries are ignored and refetched."""
+        api_cache.write_text(contents)
+        mock_response = MagicMock()
+        mock_response.read.return_value = b'{"tag_name": "v0.2.0"}'
+        mock_response.headers = {"ETag": '"abc"'}
+        mock_response.__enter__ = MagicMock(return_value=mock_response)
+        mock_response.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = mock_response
+        
+        result = _fetch_github_api("/a")
+        
+        request = mock_urlopen.call_args[0][0]
+        assert request.get_header("If-none-match") is None
+        assert result == {"tag_name": "v0.2.0"}
+    
+    @patch("ot.updater.urlopen")
+    def test_exhausted_rate_limit_skips_request(self, mock_urlopen, api_cache):
+        """Test that no request is made until the rate limit resets."""
+        api_cache.write_text(json.dumps({
+            "responses": {},
+            "rate_limit_reset": int(time.time()) + 600,
+        }))
+        
+        with pytest.raises(UpdateError, match="rate limit"):
+            _fetch_github_api("/repos/test/repo/releases/latest")
+        
+        mock_urlopen.assert_not_called()
 
 
-class TestCheckForUpdates:
-    """Tests for check_for_updates function."""
+class _FakeUrllib3Error(Exception):
+    """Stand-in for urllib3.exceptions.HTTPError."""
+
+
+class _FakeUrllib3Timeout(_FakeUrllib3Error):
+    """Stand-in for urllib3.exceptions.TimeoutError."""
+
+
+class _FakeUrllib3MaxRetry(_FakeUrllib3Error):
+    """Stand-in for urllib3.exceptions.MaxRetryError."""
     
-    @patch("ot.updater.get_latest_release")
-    @patch("ot.updater.get_current_version")
-    def test_update_available(self, mock_current, mock_release):
-        """Test when an update is available."""
-        mock_current.return_value = "0.1.0"
-        mock_release.return_value = {
-            "tag_name": "v0.2.0",
-            "html_url": "https://github.com/test/repo/releases/tag/v0.2.0",
-            "body": "New features",
-            "published_at": "2024-01-01T00:00:00Z",
-        }
+    def __init__(self, reason: Exception):
+        super().__init__(f"Max retries exceeded ({reason})")
+        self.reason = reason
+
+
+class TestFetchWithPool:
+    """Tests for _fetch_github_api through the urllib3 pool."""
+    
+    @pytest.fixture
+    def pool(self, tmp_path: Path):
+        """Install a fake pool and point the response cache at tmp_path."""
+        pool = MagicMock()
+        exceptions = SimpleNamespace(
+            HTTPError=_FakeUrllib3Error,
+            TimeoutError=_FakeUrllib3Timeout,
+            MaxRetryError=_FakeUrllib3MaxRetry,
+        )
+        with patch("ot.updater._API_CACHE_FILE", tmp_path / "github_api.json"), \
+                patch("ot.updater._urllib3_pool", return_value=(pool, exceptions)), \
+                patch("ot.updater.urlopen", side_effect=AssertionError("urlopen used")):
+            yield pool
+    
+    def test_successful_fetch(self, pool):
+        """Test that the request goes through the pool."""
+        pool.request.return_value = SimpleNamespace(
+            status=200, reason="OK", headers={}, data=b'{"tag_name": "v0.2.0"}'
+        )
         
-        info = check_for_updates()
+        result = _fetch_github_api("/repos/test/repo/releases/latest")
         
-        assert info.current_version == "0.1.0"
-        assert info.latest_version == "0.2.0"
-        assert info.is_latest is False
+        assert result == {"tag_name": "v0.2.0"}
+        method, url = pool.request.call_args[0]
+        assert (method, url) == ("GET", "https://api.github.com/repos/test/repo/releases/latest")
     
+    def test_not_found(self, pool):
+        """Test that a 404 status maps to UpdateError."""
+        pool.request.return_value = SimpleNamespace(
+            status=404, reason="Not Found", headers={}, data=b""
+        )
+        
+        with pytest.raises(UpdateError, match="not found"):
+            _fetch_github_api("/repos/test/repo/releases/latest")
+    
+    @pytest.mark.parametrize("decoder", ["json", "orjson"])
+    def test_decoders(self, pool, decoder):
+        """Test that both JSON decoders parse and reject bodies alike."""
+        loads = pytest.importorskip(decoder).loads
+        pool.request.return_value = SimpleNamespace(
+            status=200, reason="OK", headers={}, data=b'{"tag_name": "v0.2.0"}'
+        )
+        
+        with patch("ot.updater._json_loads", return_value=loads):
+            assert _fetch_github_api("/a") == {"tag_name": "v0.2.0"}
+            
+            pool.request.return_value.data = b"<html>"
+            with pytest.raises(UpdateError, match="Invalid API response"):
+                _fetch_github_api("/b")
+    
+    @pytest.mark.parametrize(("error", "message"), [
+        (_FakeUrllib3Timeout("read timed out"), "timed out"),
+        (_FakeUrllib3Error("connection refused"), "Network error"),
+        (_FakeUrllib3MaxRetry(_FakeUrllib3Timeout("read timed out")), "timed out"),
+        (_FakeUrllib3MaxRetry(_FakeUrllib3Error("connection refused")), "Network error"),
+    ])
+    def test_transport_errors(self, pool, error, message):
+        """Test that urllib3 errors map to UpdateError."""
+        pool.request.side_effect = error
+        
+        with pytest.raises(UpdateError, match=message):
+            _fetch_github_api("/repos/test/repo/releases/latest")
+
+
+class TestCheckForUpdates:
+    """Tests for check_for_updates function."""
+    
+    @pytest.mark.parametrize("current,expected_is_latest", [
+        ("0.1.0", False),
+        ("0.2.0", True),
+        ("0.3.0", True),
+    ])
     @patch("ot.updater.get_latest_release")
     @patch("ot.updater.get_current_version")
-    def test_already_latest(self, mock_current, mock_release):
-        """Test when already at latest version."""
-        mock_current.return_value = "0.2.0"
-        mock_release.return_value = {
-            "tag_name": "v0.2.0",
-            "html_url": "https://github.com/test/repo/releases/tag/v0.2.0",
-            "body": None,
-            "published_at": None,
-        }
+    def test_check(self, mock_current, mock_release, current, expected_is_latest):
+        """Test older, equal and newer (dev build) current versions."""
+        mock_current.return_value = current
+        mock_release.return_value = _LATEST
         
         info = check_for_updates()
         
-        assert info.is_latest is True
+        assert info.current_version == current
+        assert info.latest_version == "0.2.0"
+        assert info.is_latest is expected_is_latest
+        assert info.release_url == _LATEST["html_url"]
     
     @patch("ot.updater.get_latest_release")
-    @patch("ot.updater.get_current_version")
-    def test_current_newer_than_release(self, mock_current, mock_release):
-        """Test when current version is newer (dev build)."""
-        mock_current.return_value = "0.3.0"
-        mock_release.return_value = {
-            "tag_name": "v0.2.0",
-            "html_url": None,
-            "body": None,
-            "published_at": None,
-        }
+    @patch("ot.updater.get_current_version", return_value="0.1.0")
+    def test_result_is_reused(self, mock_current, mock_release):
+        """Test that a second check within the TTL does not refetch."""
+        mock_release.return_value = _LATEST
         
-        info = check_for_updates()
+        first = check_for_updates()
+        second = check_for_updates()
         
-        assert info.is_latest is True
+        assert second is first
+        mock_release.assert_called_once()
 
 
 class TestPerformUpdate:
     """Tests for perform_update function."""
     
-    @patch("ot.updater.subprocess.run")
-    @patch("ot.updater.check_for_updates")
-    @patch("ot.updater.get_logger")
-    def test_skip_when_latest(self, mock_logger, mock_check, mock_run):
+    @pytest.fixture(autouse=True)
+    def patched_updater(self, monkeypatch, fake_runner):
+        """Replace pip, the update check and the logger in ot.updater.
+        
+        Tests set ``info`` to the check result and ``run`` to configure
+        or inspect pip; ``checks`` counts calls to check_for_updates.
+        """
+        state = SimpleNamespace(run=fake_runner, info=None, checks=0)
+        
+        def fake_check():
+            state.checks += 1
+            return state.info
+        
+        monkeypatch.setattr("ot.updater.subprocess.run", fake_runner)
+        monkeypatch.setattr("ot.updater.check_for_updates", fake_check)
+        monkeypatch.setattr("ot.updater.get_logger", lambda: logging.getLogger(__name__))
+        return state
+    
+    def test_skip_when_latest(self, patched_updater):
         """Test that update is skipped when already at latest."""
-        mock_logger.return_value = MagicMock()
-        mock_check.return_value = UpdateInfo(
+        patched_updater.info = UpdateInfo(
             current_version="0.2.0",
             latest_version="0.2.0",
             is_latest=True,
@@ -262,40 +423,41 @@ class TestPerformUpdate:
         result = perform_update(force=False)
         
         assert result is True
-        mock_run.assert_not_called()
+        assert patched_updater.run.calls == []
     
-    @patch("ot.updater.subprocess.run")
-    @patch("ot.updater.check_for_updates")
-    @patch("ot.updater.get_logger")
-    def test_force_update_when_latest(self, mock_logger, mock_check, mock_run):
+    def test_force_update_when_latest(self, patched_updater):
         """Test force update even when at latest."""
-        mock_logger.return_value = MagicMock()
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-        
         result = perform_update(force=True)
         
         assert result is True
-        mock_run.assert_called_once()
+        assert patched_updater.checks == 0
+        assert len(patched_updater.run.calls) == 1
+        assert patched_updater.run.calls[0][1:4] == ["-m", "pip", "install"]
     
-    @patch("ot.updater.subprocess.run")
-    @patch("ot.updater.check_for_updates")
-    @patch("ot.updater.get_logger")
-    def test_update_failure(self, mock_logger, mock_check, mock_run):
+    def test_update_failure(self, patched_updater):
         """Test handling update failure."""
-        mock_logger.return_value = MagicMock()
-        mock_check.return_value = UpdateInfo(
+        patched_updater.info = UpdateInfo(
             current_version="0.1.0",
             latest_version="0.2.0",
             is_latest=False,
         )
-        mock_run.return_value = MagicMock(
-            returncode=1,
-            stdout="",
-            stderr="Permission denied",
-        )
+        patched_updater.run.returncode = 1
+        patched_updater.run.stderr = "Permission denied"
         
         with pytest.raises(UpdateError, match="pip install failed"):
             perform_update()
+    
+    def test_reuses_given_info(self, patched_updater):
+        """Test that a passed-in check result is not re-fetched."""
+        info = UpdateInfo(
+            current_version="0.2.0",
+            latest_version="0.2.0",
+            is_latest=True,
+        )
+        
+        assert perform_update(info=info) is True
+        assert patched_updater.checks == 0
+        assert patched_updater.run.calls == []
 
 
 class TestGetUpdateCommand:
@@ -305,8 +467,8 @@ class TestGetUpdateCommand:
         """Test that get_update_command returns valid pip command."""
         cmd = get_update_command()
         
-        assert "pip install" in cmd
+        assert "pip install" in " ".join(cmd)
         assert "--upgrade" in cmd
-        assert "github.com" in cmd
-        assert "StrongTechProject" in cmd
-        assert "Obsidian-TimeMachine" in cmd
+        assert "github.com" in cmd[-1]
+        assert "StrongTechProject" in cmd[-1]
+        assert "Obsidian-TimeMachine" in cmd[-1]